@@ -11,8 +11,8 @@ from pathlib import Path
 from typing import List, Optional, Union
 from xml.dom import minidom
 from xml.etree import ElementTree
-from xml.etree.ElementTree import Element as EtElement
 
+import numpy as np
 import pandas as pd
 import yaml
 
@@ -21,6 +21,7 @@ from brainglobe_utils.cells.cells import (
     MissingCellsError,
     UntypedCell,
     pos_from_file_name,
+    to_numpy_pos,
 )
 from brainglobe_utils.general.system import replace_extension
 
@@ -271,7 +272,13 @@ def cells_xml_to_df(xml_file_path):
 
 
 def cells_to_dataframe(cells: List[Cell]) -> pd.DataFrame:
-    return pd.DataFrame([c.to_dict() for c in cells])
+    # build each column directly, rather than a dict per cell
+    return pd.DataFrame(
+        {
+            key: [getattr(cell, key) for cell in cells]
+            for key in ("x", "y", "z", "type")
+        }
+    )
 
 
 def cells_to_csv(cells: List[Cell], csv_file_path: Union[str, Path]):
@@ -300,35 +307,56 @@ def make_xml(cell_list, indentation_str, artifact_keep=True):
     bytes
         Cell list as xml, ready to be saved into a file.
     """
-    root = EtElement("CellCounter_Marker_File")
-    image_properties = EtElement("Image_Properties")
-    file_name = EtElement("Image_Filename")
-    file_name.text = "placeholder.tif"
-    image_properties.append(file_name)
-    root.append(image_properties)
-
-    marker_data = EtElement("Marker_Data")
-    current_type = EtElement("Current_Type")
-    current_type.text = str(1)  # TODO: check
-    marker_data.append(current_type)
-
     cell_dict = make_type_dict(cell_list)
 
     # if artifacts exist, do something with them (convert/delete)
     if Cell.ARTIFACT in cell_dict:
         cell_dict = deal_with_artifacts(cell_dict, artifact_keep=artifact_keep)
 
+    # the layout is fixed and every value is an integer (so nothing needs
+    # escaping), so write the indented xml text directly, rather than
+    # building an element tree and serializing it node by node
+    indent = [indentation_str * depth for depth in range(5)]
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        "<CellCounter_Marker_File>",
+        indent[1] + "<Image_Properties>",
+        indent[2] + "<Image_Filename>placeholder.tif</Image_Filename>",
+        indent[1] + "</Image_Properties>",
+        indent[1] + "<Marker_Data>",
+        indent[2] + "<Current_Type>1</Current_Type>",  # TODO: check
+    ]
+
+    n_clipped = 0
     for cell_type, cells in cell_dict.items():
-        type_el = EtElement("Type")
-        type_el.text = str(cell_type)
-        mt = EtElement("Marker_Type")
-        mt.append(type_el)
-        for cell in cells:
-            mt.append(cell.to_xml_element())
-        marker_data.append(mt)
-    root.append(marker_data)
-
-    return pretty_xml(root, indentation_str)
+        lines.append(indent[2] + "<Marker_Type>")
+        lines.append(indent[3] + "<Type>{}</Type>".format(cell_type))
+
+        # truncate and clip all the coordinates at once, then convert them to
+        # python ints in one go rather than per coordinate
+        coords = to_numpy_pos(cells).astype(np.int64)
+        too_small = coords < 1
+        n_clipped += int(np.count_nonzero(too_small))
+        coords[too_small] = 1  # FIXME:
+        lines.extend(
+            f"{indent[3]}<Marker>\n"
+            f"{indent[4]}<MarkerX>{x}</MarkerX>\n"
+            f"{indent[4]}<MarkerY>{y}</MarkerY>\n"
+            f"{indent[4]}<MarkerZ>{z}</MarkerZ>\n"
+            f"{indent[3]}</Marker>"
+            for x, y, z in coords.tolist()
+        )
+        lines.append(indent[2] + "</Marker_Type>")
+
+    lines += [indent[1] + "</Marker_Data>", "</CellCounter_Marker_File>", ""]
+
+    if n_clipped:
+        logging.warning(
+            "{} cell coordinates were less than 1, defaulting them to "
+            "1".format(n_clipped)
+        )
+
+    return "\n".join(lines).encode("utf-8")
 
 
 def deal_with_artifacts(cell_dict, artifact_keep=True):
@@ -2,8 +2,10 @@ import glob
 import logging
 import math
 import os
+import shutil
 import warnings
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from typing import Tuple
 
@@ -525,46 +527,149 @@ def threaded_load_from_sequence(
     ImageIOLoadException
         If attempt to load a sequence of images with different shapes.
     """
-    stacks = []
     n_processes = get_num_processes(min_free_cpu_cores=n_free_cpus)
 
-    # WARNING: will not work with interactive interpreter.
-    pool = ProcessPoolExecutor(max_workers=n_processes)
-    # FIXME: should detect and switch to other method
-
-    n_paths_per_subsequence = math.ceil(len(paths_sequence) / n_processes)
-    for i in range(n_processes):
-        start_idx = i * n_paths_per_subsequence
-        if start_idx >= len(paths_sequence):
-            break
-        else:
-            end_idx = start_idx + n_paths_per_subsequence
-
-            if end_idx <= len(paths_sequence):
-                sub_paths = paths_sequence[start_idx:end_idx]
-            else:
-                sub_paths = paths_sequence[start_idx:]
-
-        process = pool.submit(
-            load_from_paths_sequence,
-            sub_paths,
+    # Load the first plane here, to find the shape and type of the volume
+    first_plane, dtype = _load_first_plane(
+        paths_sequence, x_scaling_factor, y_scaling_factor, anti_aliasing
+    )
+    shape = (len(paths_sequence), *first_plane.shape)
+    n_bytes = math.prod(shape) * dtype.itemsize
+    if not _fits_in_shared_memory(n_bytes):
+        return _load_subsequences(
+            paths_sequence,
             x_scaling_factor,
             y_scaling_factor,
-            anti_aliasing=anti_aliasing,
+            anti_aliasing,
+            n_processes,
         )
-        stacks.append(process)
 
-    stack_shapes = set()
-    for i in range(len(stacks)):
-        stacks[i] = stacks[i].result()
-        stack_shapes.add(stacks[i].shape[0:2])
+    # The worker processes write their planes directly into shared memory,
+    # rather than returning (and so copying) their part of the volume
+    shared_memory = SharedMemory(create=True, size=max(1, n_bytes))
+    planes = np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+    try:
+        planes[0] = first_plane
+
+        # WARNING: will not work with interactive interpreter.
+        with ProcessPoolExecutor(max_workers=n_processes) as pool:
+            n_paths_per_subsequence = max(
+                1, math.ceil((len(paths_sequence) - 1) / n_processes)
+            )
+            futures = [
+                pool.submit(
+                    _load_planes_into_shared_memory,
+                    shared_memory.name,
+                    shape,
+                    dtype,
+                    start_idx,
+                    paths_sequence[
+                        start_idx : start_idx + n_paths_per_subsequence
+                    ],
+                    x_scaling_factor,
+                    y_scaling_factor,
+                    anti_aliasing,
+                )
+                for start_idx in range(
+                    1, len(paths_sequence), n_paths_per_subsequence
+                )
+            ]
+            for future in futures:
+                future.result()
+
+        # Copy the volume out of the shared memory, so it can be released
+        volume = planes.copy()
+    finally:
+        # The shared memory can only be closed once nothing refers to it
+        del planes
+        shared_memory.close()
+        shared_memory.unlink()
+
+    return np.moveaxis(volume, 0, 2)
+
+
+def _fits_in_shared_memory(n_bytes):
+    """
+    Whether there is room for n_bytes of shared memory. On Linux, shared
+    memory is held in /dev/shm, which can be much smaller than the RAM
+    (e.g. 64 MB by default in docker containers).
+    """
+    if not os.path.isdir("/dev/shm"):
+        return True
+    return n_bytes <= shutil.disk_usage("/dev/shm").free
+
+
+def _load_subsequences(
+    paths_sequence,
+    x_scaling_factor,
+    y_scaling_factor,
+    anti_aliasing,
+    n_processes,
+):
+    """
+    Load a sequence in n_processes parts, each of which is loaded by a
+    worker process and returned (so copied) to be stacked. Used by
+    threaded_load_from_sequence when the volume doesn't fit in shared
+    memory.
+    """
+    stacks = []
+    # WARNING: will not work with interactive interpreter.
+    with ProcessPoolExecutor(max_workers=n_processes) as pool:
+        n_paths_per_subsequence = math.ceil(len(paths_sequence) / n_processes)
+        for start_idx in range(
+            0, len(paths_sequence), n_paths_per_subsequence
+        ):
+            sub_paths = paths_sequence[
+                start_idx : start_idx + n_paths_per_subsequence
+            ]
+            process = pool.submit(
+                load_from_paths_sequence,
+                sub_paths,
+                x_scaling_factor,
+                y_scaling_factor,
+                anti_aliasing=anti_aliasing,
+            )
+            stacks.append(process)
+
+        stack_shapes = set()
+        for i in range(len(stacks)):
+            stacks[i] = stacks[i].result()
+            stack_shapes.add(stacks[i].shape[0:2])
 
     # Raise an error if the x/y shape of all stacks aren't the same
     if len(stack_shapes) > 1:
         raise ImageIOLoadException("sequence_shape")
 
-    stack = np.dstack(stacks)
-    return stack
+    return np.dstack(stacks)
+
+
+def _load_planes_into_shared_memory(
+    shared_memory_name,
+    shape,
+    dtype,
+    start_idx,
+    paths,
+    x_scaling_factor,
+    y_scaling_factor,
+    anti_aliasing,
+):
+    """
+    Load planes into a (z, y, x) volume held in shared memory, starting at
+    plane start_idx. Run in a worker process by threaded_load_from_sequence.
+    """
+    shared_memory = SharedMemory(name=shared_memory_name)
+    planes = np.ndarray(shape, dtype=dtype, buffer=shared_memory.buf)
+    try:
+        _load_planes(
+            paths,
+            planes[start_idx : start_idx + len(paths)],
+            x_scaling_factor,
+            y_scaling_factor,
+            anti_aliasing,
+        )
+    finally:
+        del planes
+        shared_memory.close()
 
 
 def load_from_paths_sequence(
@@ -572,11 +677,10 @@ def load_from_paths_sequence(
     x_scaling_factor=1.0,
     y_scaling_factor=1.0,
     anti_aliasing=True,
+    n_threads=1,
 ):
-    # TODO: Optimise -  load threaded and process by batch
     """
-    A single core version of the function to load a brain from a sequence of
-    image paths.
+    Load a brain from a sequence of image paths, in a single process.
 
     Parameters
     ----------
@@ -597,50 +701,128 @@ def load_from_paths_sequence(
         down-scaling. It is crucial to filter when down-sampling the image to
         avoid aliasing artifacts.
 
+    n_threads : int, optional
+        Number of threads used to read (and scale) the planes. Tiff
+        decoding releases the GIL, so reading is faster with several
+        threads, particularly for compressed images.
+
     Returns
     -------
     np.ndarray
-        The loaded and scaled brain.
+        The loaded and scaled brain, with the planes along the last axis.
 
     Raises
     ------
     ImageIOLoadException
         If attempt to load a sequence of images with different shapes.
     """
-    for i, p in enumerate(
-        tqdm(paths_sequence, desc="Loading images", unit="plane")
-    ):
-        img = tifffile.imread(p)
-        if i == 0:
-            check_mem(
-                img.nbytes * x_scaling_factor * y_scaling_factor,
-                len(paths_sequence),
-            )
-            # TEST: add test case for shape rounding
-            volume = np.empty(
-                (
-                    int(round(img.shape[0] * x_scaling_factor)),
-                    int(round(img.shape[1] * y_scaling_factor)),
-                    len(paths_sequence),
-                ),
-                dtype=img.dtype,
+    first_plane, dtype = _load_first_plane(
+        paths_sequence, x_scaling_factor, y_scaling_factor, anti_aliasing
+    )
+    planes = np.empty((len(paths_sequence), *first_plane.shape), dtype=dtype)
+    planes[0] = first_plane
+
+    _load_planes(
+        paths_sequence[1:],
+        planes[1:],
+        x_scaling_factor,
+        y_scaling_factor,
+        anti_aliasing,
+        n_threads=n_threads,
+        initial=1,
+    )
+    # The planes are stored contiguously (so each is written in one go),
+    # and returned as a view with the planes along the last axis
+    return np.moveaxis(planes, 0, 2)
+
+
+def _load_first_plane(
+    paths_sequence, x_scaling_factor, y_scaling_factor, anti_aliasing
+):
+    """
+    Read and scale the first plane of a sequence, and check there is enough
+    memory to load the whole sequence.
+
+    Returns the scaled plane, and the dtype of the loaded volume. This is
+    the dtype of the images, even when they are scaled (which gives floats).
+    """
+    img = tifffile.imread(paths_sequence[0])
+    first_plane = _scale_plane(
+        img, x_scaling_factor, y_scaling_factor, anti_aliasing
+    )
+    check_mem(first_plane.size * img.dtype.itemsize, len(paths_sequence))
+    return first_plane, img.dtype
+
+
+def _load_plane(path, x_scaling_factor, y_scaling_factor, anti_aliasing):
+    """
+    Read a single plane, and scale it.
+    """
+    return _scale_plane(
+        tifffile.imread(path),
+        x_scaling_factor,
+        y_scaling_factor,
+        anti_aliasing,
+    )
+
+
+def _scale_plane(img, x_scaling_factor, y_scaling_factor, anti_aliasing):
+    """
+    Scale a single plane (if either scaling factor isn't 1).
+    """
+    if x_scaling_factor != 1 or y_scaling_factor != 1:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            img = transform.rescale(
+                img,
+                (x_scaling_factor, y_scaling_factor),
+                mode="constant",
+                preserve_range=True,
+                anti_aliasing=anti_aliasing,
             )
-        if x_scaling_factor != 1 or y_scaling_factor != 1:
-            with warnings.catch_warnings():
-                warnings.simplefilter("ignore")
-                img = transform.rescale(
-                    img,
-                    (x_scaling_factor, y_scaling_factor),
-                    mode="constant",
-                    preserve_range=True,
-                    anti_aliasing=anti_aliasing,
-                )
+    return img
+
 
+def _load_planes(
+    paths,
+    planes,
+    x_scaling_factor,
+    y_scaling_factor,
+    anti_aliasing,
+    n_threads=1,
+    initial=0,
+):
+    """
+    Read and scale planes into planes[i], for each of the paths.
+
+    The planes are read by a pool of n_threads threads (if more than one).
+    initial is the number of planes already loaded, for the progress bar.
+    """
+
+    def load(i):
+        img = _load_plane(
+            paths[i], x_scaling_factor, y_scaling_factor, anti_aliasing
+        )
         # Raise an error if the shapes of the images aren't the same
-        if not volume[:, :, i].shape == img.shape:
+        if planes[i].shape != img.shape:
             raise ImageIOLoadException("sequence_shape")
-        volume[:, :, i] = img
-    return volume
+        planes[i] = img
+
+    progress = tqdm(
+        total=len(paths) + initial,
+        initial=initial,
+        desc="Loading images",
+        unit="plane",
+    )
+    with progress:
+        if n_threads > 1:
+            with ThreadPoolExecutor(max_workers=n_threads) as executor:
+                for _ in executor.map(load, range(len(paths))):
+                    progress.update()
+        else:
+            for i in range(len(paths)):
+                load(i)
+                progress.update()
 
 
 def get_size_image_from_file_paths(file_path, file_extension="tif"):
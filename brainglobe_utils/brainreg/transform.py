@@ -1,22 +1,69 @@
+import itertools
 import logging
 import os
-from typing import List, Optional, Tuple
+from typing import List, Literal, Optional, Tuple, Union
 
 import brainglobe_space as bgs
 import numpy as np
 import pandas as pd
 import tifffile
 from brainglobe_atlasapi import BrainGlobeAtlas
+from numba import njit, prange
 
 from brainglobe_utils.IO.image import get_size_image_from_file_paths
 
 
+@njit(parallel=True, cache=True)
+def _sample_deformation_field(
+    points: np.ndarray, deformation_field: np.ndarray, scale: float
+) -> np.ndarray:
+    """
+    Returns the value of the deformation field at each (in bounds) point,
+    multiplied by `scale` and rounded to the nearest integer.
+
+    The lookup, scaling and rounding are done in a single pass, without
+    allocating any index or intermediate arrays.
+    """
+    values = np.empty(points.shape[0], dtype=np.int64)
+    for i in prange(points.shape[0]):
+        value = deformation_field[points[i, 0], points[i, 1], points[i, 2]]
+        values[i] = np.int64(np.rint(value * scale))
+    return values
+
+
+def _interpolate_deformation_field(
+    points: np.ndarray, deformation_field: np.ndarray, scale: float
+) -> np.ndarray:
+    """
+    Returns the trilinearly interpolated value of the deformation field at
+    each (in bounds) point, multiplied by `scale` and rounded to the nearest
+    integer.
+    """
+    max_index = np.array(deformation_field.shape[:3]) - 1
+    points = np.clip(points, 0, max_index)
+    lower = np.floor(points).astype(np.int64)
+    upper = np.minimum(lower + 1, max_index)
+    fraction = points - lower
+
+    # weighted sum of the 8 voxels surrounding each point
+    values = np.zeros(len(points), dtype=np.float64)
+    for corner in itertools.product((False, True), repeat=3):
+        indices = np.where(corner, upper, lower)
+        weights = np.prod(np.where(corner, fraction, 1 - fraction), axis=1)
+        values += (
+            weights
+            * deformation_field[indices[:, 0], indices[:, 1], indices[:, 2]]
+        )
+    return np.rint(values * scale).astype(np.int64)
+
+
 def transform_points_from_downsampled_to_atlas_space(
     downsampled_points: np.ndarray,
     atlas: BrainGlobeAtlas,
-    deformation_field_paths: List[os.PathLike],
+    deformation_field_paths: List[Union[os.PathLike, np.ndarray]],
     output_filename: Optional[os.PathLike] = None,
     warn_out_of_bounds: bool = True,
+    interpolation: Literal["nearest", "trilinear"] = "nearest",
 ) -> Tuple[np.ndarray, List]:
     """
     Transform points from the "downsampled" space in brainreg (i.e. raw data
@@ -31,12 +78,20 @@ def transform_points_from_downsampled_to_atlas_space(
     atlas :
         Target BrainGlobe atlas.
     deformation_field_paths :
-        File paths to the deformation fields as generated by brainreg.
+        File paths to the deformation fields as generated by brainreg, or
+        the already loaded deformation fields. Passing loaded fields avoids
+        reading them again when transforming several sets of points with the
+        same registration.
     output_filename :
         File to save transformed points to. Points are saved as a HDF file
         using pandas.
     warn_out_of_bounds :
         Whether to warn if points fall outside of the atlas space.
+    interpolation :
+        How to sample the deformation fields at each point. "nearest" uses
+        the voxel nearest to the point, "trilinear" interpolates between the
+        8 voxels surrounding it. In both cases, points whose nearest voxel is
+        outside the deformation field are out of bounds.
 
     Returns
     -------
@@ -47,32 +102,64 @@ def transform_points_from_downsampled_to_atlas_space(
         Points that fall outside of the transformed atlas space.
     """
 
+    if interpolation not in ("nearest", "trilinear"):
+        raise ValueError(
+            f"Unknown interpolation: {interpolation}. "
+            f"Use 'nearest' or 'trilinear'."
+        )
+
     field_scales = [int(1000 / resolution) for resolution in atlas.resolution]
-    points: List[List] = [[], [], []]
-    points_out_of_bounds = []
+    downsampled_points = np.asarray(downsampled_points, dtype=np.float64)
+    downsampled_points = downsampled_points.reshape(-1, 3)
+    rounded_points = np.rint(downsampled_points).astype(np.int64)
+
+    points: List[np.ndarray] = []
+    in_bounds = None
     for axis, deformation_field_path in enumerate(deformation_field_paths):
-        deformation_field = tifffile.imread(deformation_field_path)
-        for point in downsampled_points:
-            try:
-                point = [int(round(p)) for p in point]
-                points[axis].append(
-                    int(
-                        round(
-                            field_scales[axis]
-                            * deformation_field[point[0], point[1], point[2]]
-                        )
-                    )
+        if isinstance(deformation_field_path, np.ndarray):
+            deformation_field = deformation_field_path
+        else:
+            deformation_field = tifffile.imread(deformation_field_path)
+        # the lookups below are fastest on a C-contiguous array (a no-op for
+        # fields as written by brainreg)
+        deformation_field = np.ascontiguousarray(deformation_field)
+        if in_bounds is None:
+            # all deformation fields share the same shape, so the points
+            # that can be looked up only need to be found once
+            in_bounds = np.all(
+                (rounded_points >= 0)
+                & (rounded_points < deformation_field.shape[:3]),
+                axis=1,
+            )
+            in_bounds_points = np.ascontiguousarray(rounded_points[in_bounds])
+        # scale in the field's own (floating point) precision
+        scale = np.result_type(deformation_field.dtype, np.float32).type(
+            field_scales[axis]
+        )
+        if interpolation == "trilinear":
+            points.append(
+                _interpolate_deformation_field(
+                    downsampled_points[in_bounds], deformation_field, scale
                 )
-            except IndexError:
-                if point not in points_out_of_bounds:
-                    points_out_of_bounds.append(point)
-                    if warn_out_of_bounds:
-                        logging.info(
-                            f"Ignoring point: {point} "
-                            f"as it falls outside the atlas."
-                        )
+            )
+        else:
+            points.append(
+                _sample_deformation_field(
+                    in_bounds_points, deformation_field, scale
+                )
+            )
+
+    # unique out of bounds points, in the order they were given
+    out_of_bounds = rounded_points[~in_bounds]
+    _, first_index = np.unique(out_of_bounds, axis=0, return_index=True)
+    points_out_of_bounds = out_of_bounds[np.sort(first_index)].tolist()
+    if warn_out_of_bounds and points_out_of_bounds:
+        logging.info(
+            f"Ignoring {len(points_out_of_bounds)} points as they fall "
+            f"outside the atlas: {points_out_of_bounds}"
+        )
 
-    transformed_points = np.array(points).T
+    transformed_points = np.stack(points, axis=1)
 
     if output_filename is not None:
         df = pd.DataFrame(transformed_points)
@@ -166,7 +253,7 @@ def transform_points_to_atlas_space(
     voxel_sizes: List[float],
     downsampled_space: bgs.AnatomicalSpace,
     atlas: BrainGlobeAtlas,
-    deformation_field_paths: List[os.PathLike],
+    deformation_field_paths: List[Union[os.PathLike, np.ndarray]],
     downsampled_points_path: Optional[os.PathLike] = None,
     atlas_points_path: Optional[os.PathLike] = None,
 ) -> np.ndarray:
@@ -191,8 +278,9 @@ def transform_points_to_atlas_space(
         The BrainGlobe anatomical space representing the downsampled space
     atlas : BrainGlobeAtlas
         The BrainGlobe atlas object used for registration
-    deformation_field_paths : List[os.PathLike]
-        File paths to the deformation fields as generated by brainreg.
+    deformation_field_paths : List[Union[os.PathLike, np.ndarray]]
+        File paths to the deformation fields as generated by brainreg, or
+        the already loaded deformation fields.
     downsampled_points_path : Optional[os.PathLike], optional
         The file path where the downsampled points
         should be saved (default is None).
@@ -3,6 +3,7 @@ Based on https://github.com/SainsburyWellcomeCentre/niftynet_cell_count by
 Christian Niedworok (https://github.com/cniedwor).
 """
 
+import logging
 import math
 import os
 import re
@@ -11,6 +12,7 @@ from collections import defaultdict
 from functools import total_ordering
 from typing import (
     Any,
+    Callable,
     DefaultDict,
     Dict,
     List,
@@ -22,7 +24,7 @@ from xml.etree import ElementTree
 from xml.etree.ElementTree import Element as EtElement
 
 import numpy as np
-from numba import njit, objmode
+from numba import get_num_threads, njit, objmode, prange
 from tqdm import tqdm
 
 
@@ -75,6 +77,18 @@ class Cell:
         Hemisphere of brain.
     """
 
+    __slots__ = (
+        "x",
+        "y",
+        "z",
+        "transformed_x",
+        "transformed_y",
+        "transformed_z",
+        "structure_id",
+        "hemisphere",
+        "type",
+    )
+
     # integers for self.type
     ARTIFACT = -1
     CELL = 2
@@ -88,12 +102,10 @@ class Cell:
         pos: Union[str, ElementTree.Element, Dict[str, float], List[float]],
         cell_type: int,
     ):
-        if isinstance(pos, str):
-            pos = pos_from_file_name(os.path.basename(pos))
-        if isinstance(pos, ElementTree.Element):
-            pos = pos_from_xml_marker(pos)
-        if isinstance(pos, dict):
-            pos = pos_from_dict(pos)
+        # look up the exact type first, as it is much faster than isinstance
+        parser = _POSITION_PARSERS.get(type(pos), _parse_position)
+        if parser is not None:
+            pos = parser(pos)
         pos = self._sanitize_position(pos)
         x, y, z = [int(p) for p in pos]
         self.x: float = x
@@ -108,29 +120,37 @@ class Cell:
         self.hemisphere = None
 
         self.type: int
-        if cell_type is None:
+        if type(cell_type) is int:
+            self.type = cell_type
+        elif cell_type is None:
             self.type = Cell.UNKNOWN
-        elif str(cell_type).lower() == "cell":
-            self.type = Cell.CELL
-        elif str(cell_type).lower() == "no_cell":
-            self.type = Cell.ARTIFACT
         else:
-            self.type = int(cell_type)
+            type_name = str(cell_type).lower()
+            if type_name in _CELL_TYPE_NAMES:
+                self.type = _CELL_TYPE_NAMES[type_name]
+            else:
+                self.type = int(cell_type)
 
+    @staticmethod
     def _sanitize_position(
-        self, pos: List[float], verbose: bool = True
+        pos: List[float], verbose: bool = True
     ) -> List[float]:
-        out = []
-        for coord in pos:
-            if math.isnan(coord):
-                if verbose:
-                    print(
-                        "WARNING: NaN position for for cell\n"
-                        "defaulting to 1"
-                    )
-                coord = 1
-            out.append(coord)
-        return out
+        # NaN is the only value not equal to itself, so this checks the
+        # usual [x, y, z] position without calling math.isnan per coordinate
+        if (
+            len(pos) == 3
+            and pos[0] == pos[0]
+            and pos[1] == pos[1]
+            and pos[2] == pos[2]
+        ):
+            return pos
+
+        is_nan = [math.isnan(coord) for coord in pos]
+        if verbose and any(is_nan):
+            logging.warning(
+                "NaN position {} for cell, defaulting to 1".format(list(pos))
+            )
+        return [1 if nan else coord for coord, nan in zip(pos, is_nan)]
 
     def _transform(
         self,
@@ -269,28 +289,12 @@ class Cell:
     def __ne__(self, other: Any) -> bool:
         return not (self == other)
 
-    def __lt__(self, other: Any) -> Union[bool, NotImplementedError]:
-        if self == other:
-            return False
+    def __lt__(self, other: Any) -> bool:
+        """Order cells by z, then y, then x position"""
         try:
-            if self.z < other.z:
-                return True
-            elif self.z > other.z:
-                return False
-            elif self.y < other.y:
-                return True
-            elif self.y > other.y:
-                return False
-            elif self.x < other.x:
-                return True
-            else:
-                return False
-        except AttributeError as err:
-            return NotImplementedError(
-                "comparison to {} is not implemented, {}".format(
-                    type(other), err
-                )
-            )
+            return (self.z, self.y, self.x) < (other.z, other.y, other.x)
+        except AttributeError:
+            return NotImplemented
 
     def __str__(self) -> str:
         return "Cell: x: {}, y: {}, z: {}, type: {}".format(
@@ -306,7 +310,7 @@ class Cell:
         return {"x": self.x, "y": self.y, "z": self.z, "type": self.type}
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return hash((self.x, self.y, self.z, self.type))
 
 
 class UntypedCell(Cell):
@@ -325,6 +329,9 @@ class UntypedCell(Cell):
     Cell : For description of attributes.
     """
 
+    # type is a read-only property, so no extra storage is needed
+    __slots__ = ()
+
     def __init__(
         self,
         pos: Union[str, ElementTree.Element, Dict[str, float], List[float]],
@@ -352,21 +359,65 @@ def pos_from_dict(position_dict: Dict[str, float]) -> List[float]:
     return [position_dict["x"], position_dict["y"], position_dict["z"]]
 
 
+_MARKER_NAMES = tuple("Marker{}".format(axis) for axis in "XYZ")
+
+
 def pos_from_xml_marker(element: ElementTree.Element) -> List[float]:
     """Return [x, y, z] position from xml marker"""
-    marker_names = ["Marker{}".format(axis) for axis in "XYZ"]
-    markers = [element.find(marker_name) for marker_name in marker_names]
-    pos = [marker.text for marker in markers if marker is not None]
-    return [float(num) for num in pos if num is not None]
+    # findtext gives None for a missing marker, and "" for an empty one
+    texts = [element.findtext(marker_name) for marker_name in _MARKER_NAMES]
+    return [float(text) for text in texts if text]
+
+
+# an axis letter followed by its position, e.g. "x392" in "pCellz10y522x392"
+_FILE_NAME_POS_RE = re.compile(r"([xyz])(\d+)", re.IGNORECASE)
 
 
 def pos_from_file_name(file_name: str) -> List[float]:
     """Return [x, y, z] position from filename. For example,
     'pCellz10y522x392Ch0.tif' would return [392, 522, 10]"""
-    x = re.findall(r"x\d+", file_name.lower())
-    y = re.findall(r"y\d+", file_name.lower())
-    z = re.findall(r"z\d+", file_name.lower())
-    return [int(p) for p in (x[-1][1:], y[-1][1:], z[-1][1:])]
+    # if an axis occurs more than once, the last occurrence is used
+    pos = {
+        axis.lower(): value
+        for axis, value in _FILE_NAME_POS_RE.findall(file_name)
+    }
+    if len(pos) != 3:
+        raise IndexError(
+            "Could not find an x, y and z position in {}".format(file_name)
+        )
+    return [int(pos[axis]) for axis in "xyz"]
+
+
+def _pos_from_file_path(file_path: str) -> List[float]:
+    return pos_from_file_name(os.path.basename(file_path))
+
+
+# functions to get the [x, y, z] position from each supported type of
+# position input. None means the input is already a position
+_POSITION_PARSERS: Dict[type, Optional[Callable[[Any], List[float]]]] = {
+    list: None,
+    tuple: None,
+    str: _pos_from_file_path,
+    ElementTree.Element: pos_from_xml_marker,
+    dict: pos_from_dict,
+}
+
+# cell types that can be given by name
+_CELL_TYPE_NAMES = {"cell": Cell.CELL, "no_cell": Cell.ARTIFACT}
+
+
+def _parse_position(
+    pos: Union[str, ElementTree.Element, Dict[str, float], List[float]],
+) -> List[float]:
+    """
+    Return the [x, y, z] position from any of the position inputs accepted
+    by Cell, including subclasses of the supported types (e.g. of dict) and
+    other sequences (e.g. np.ndarray).
+    """
+    for pos_type, parser in _POSITION_PARSERS.items():
+        if isinstance(pos, pos_type):
+            return pos if parser is None else parser(pos)
+    return pos
 
 
 def group_cells_by_z(cells: List[Cell]) -> DefaultDict[float, List[Cell]]:
@@ -404,18 +455,18 @@ def to_numpy_pos(
     not None) and returns a single 2d array of shape Nx3 with the
     positions of the cells.
     """
-    # for large cell list, pre-compute size
     n = len(cells)
-    if cell_type is not None:
-        n = sum([cell.type == cell_type for cell in cells])
-    np_cells = np.empty((n, 3), dtype=np.float64)
+    np_cells = np.fromiter(
+        (coord for cell in cells for coord in (cell.x, cell.y, cell.z)),
+        dtype=np.float64,
+        count=3 * n,
+    ).reshape((n, 3))
 
-    i = 0
-    for cell in cells:
-        if cell_type is not None and cell.type != cell_type:
-            continue
-        np_cells[i, :] = cell.x, cell.y, cell.z
-        i += 1
+    if cell_type is not None:
+        types = np.fromiter(
+            (cell.type for cell in cells), dtype=np.int64, count=n
+        )
+        np_cells = np_cells[types == cell_type]
 
     return np_cells
 
@@ -433,6 +484,233 @@ def from_numpy_pos(pos: np.ndarray, cell_type: int) -> List[Cell]:
     return cells
 
 
+class CellArray:
+    """
+    A collection of cells stored as arrays, rather than as a list of Cell
+    objects, so that bulk operations (e.g. selecting cells by type) are a
+    single numpy operation.
+
+    Parameters
+    ----------
+    xyz : np.ndarray
+        Cell positions, of shape Nx3.
+
+    cell_type : np.ndarray or int
+        Type of each cell, of shape N, or a single type for all cells.
+        Defaults to Cell.UNKNOWN.
+
+    transformed_xyz : np.ndarray, optional
+        Transformed cell positions, of shape Nx3. Defaults to a copy of
+        `xyz`.
+
+    Attributes
+    ----------
+    xyz : np.ndarray
+        Cell positions as float64, of shape Nx3.
+
+    type : np.ndarray
+        Cell types as int64, of shape N.
+
+    transformed_xyz : np.ndarray
+        Transformed cell positions as float64, of shape Nx3.
+    """
+
+    def __init__(
+        self,
+        xyz: np.ndarray,
+        cell_type: Union[np.ndarray, int] = Cell.UNKNOWN,
+        transformed_xyz: Optional[np.ndarray] = None,
+    ) -> None:
+        self.xyz = np.asarray(xyz, dtype=np.float64).reshape((-1, 3))
+        n = len(self.xyz)
+        self.type = np.broadcast_to(
+            np.asarray(cell_type, dtype=np.int64), (n,)
+        ).copy()
+        if transformed_xyz is None:
+            self.transformed_xyz = self.xyz.copy()
+        else:
+            self.transformed_xyz = np.asarray(
+                transformed_xyz, dtype=np.float64
+            ).reshape((n, 3))
+
+    @classmethod
+    def from_cells(cls, cells: List[Cell]) -> "CellArray":
+        """
+        Create a CellArray from the positions, transformed positions and
+        types of a list of Cell objects.
+        """
+        n = len(cells)
+        transformed_xyz = np.fromiter(
+            (
+                coord
+                for cell in cells
+                for coord in (
+                    cell.transformed_x,
+                    cell.transformed_y,
+                    cell.transformed_z,
+                )
+            ),
+            dtype=np.float64,
+            count=3 * n,
+        ).reshape((n, 3))
+        cell_type = np.fromiter(
+            (cell.type for cell in cells), dtype=np.int64, count=n
+        )
+        return cls(to_numpy_pos(cells), cell_type, transformed_xyz)
+
+    def to_cells(self) -> List[Cell]:
+        """
+        Return a list of Cell objects with the positions, transformed
+        positions and types of this CellArray.
+        """
+        return [self[i] for i in range(len(self))]
+
+    def _transform(
+        self,
+        x_scale: float = 1.0,
+        y_scale: float = 1.0,
+        z_scale: float = 1.0,
+        x_offset: float = 0,
+        y_offset: float = 0,
+        z_offset: float = 0,
+        integer: bool = False,
+    ) -> np.ndarray:
+        # one broadcast over all cells, rather than one call per cell
+        xyz = (self.xyz + (x_offset, y_offset, z_offset)) * (
+            x_scale,
+            y_scale,
+            z_scale,
+        )
+        if integer:
+            xyz = np.rint(xyz)
+        return xyz
+
+    def transform(
+        self,
+        x_scale: float = 1.0,
+        y_scale: float = 1.0,
+        z_scale: float = 1.0,
+        x_offset: float = 0,
+        y_offset: float = 0,
+        z_offset: float = 0,
+        integer: bool = False,
+    ) -> None:
+        """
+        Scale and/or offset all cell positions. .xyz will be updated.
+
+        See Also
+        --------
+        Cell.transform : For description of parameters.
+        """
+        self.xyz = self._transform(
+            x_scale, y_scale, z_scale, x_offset, y_offset, z_offset, integer
+        )
+
+    def soft_transform(
+        self,
+        x_scale: float = 1.0,
+        y_scale: float = 1.0,
+        z_scale: float = 1.0,
+        x_offset: float = 0,
+        y_offset: float = 0,
+        z_offset: float = 0,
+        integer: bool = False,
+    ) -> None:
+        """
+        Scale and/or offset all cell positions. New values will be saved into
+        .transformed_xyz. Original .xyz will remain unchanged.
+
+        See Also
+        --------
+        Cell.transform : For description of parameters.
+        """
+        self.transformed_xyz = self._transform(
+            x_scale, y_scale, z_scale, x_offset, y_offset, z_offset, integer
+        )
+
+    def group_by_z(self) -> Dict[float, np.ndarray]:
+        """
+        Group the cells by plane, like `group_cells_by_z`, but returning the
+        indices of the cells in each plane rather than the cells themselves.
+
+        Returns
+        -------
+        dict
+            Dictionary with each key being a plane (e.g. 1280), in ascending
+            order, and each entry being an array of the indices of the cells
+            in that plane.
+        """
+        z = self.xyz[:, 2]
+        order = np.argsort(z, kind="stable")
+        planes, starts = np.unique(z[order], return_index=True)
+        return dict(zip(planes.tolist(), np.split(order, starts[1:])))
+
+    def morton_order(self) -> np.ndarray:
+        """
+        Return the indices that sort the cells along a Morton (z-order)
+        curve, so that cells close together in space are also close together
+        in the sorted order, e.g. ``cell_array[cell_array.morton_order()]``.
+
+        Positions are rounded to integers and offset to start at zero, and
+        each axis may span up to 2**21 integer positions.
+        """
+        if not len(self):
+            return np.empty(0, dtype=np.intp)
+        xyz = np.rint(self.xyz - self.xyz.min(axis=0)).astype(np.uint64)
+        if xyz.max() >= 1 << 21:
+            raise ValueError(
+                "Cell positions span too large a range for Morton ordering"
+            )
+        codes = (
+            _spread_bits(xyz[:, 0])
+            | (_spread_bits(xyz[:, 1]) << np.uint64(1))
+            | (_spread_bits(xyz[:, 2]) << np.uint64(2))
+        )
+        return np.argsort(codes, kind="stable")
+
+    def __len__(self) -> int:
+        return len(self.xyz)
+
+    def __getitem__(
+        self, item: Union[int, slice, np.ndarray]
+    ) -> Union[Cell, "CellArray"]:
+        """
+        Return a Cell for an integer index, or a new CellArray for a slice,
+        an index array or a boolean mask, e.g.
+        ``cell_array[cell_array.type == Cell.CELL]``.
+        """
+        if isinstance(item, (int, np.integer)):
+            cell = Cell(self.xyz[item].tolist(), int(self.type[item]))
+            # Cell truncates its position to integers, so set it directly
+            cell.x, cell.y, cell.z = self.xyz[item].tolist()
+            (
+                cell.transformed_x,
+                cell.transformed_y,
+                cell.transformed_z,
+            ) = self.transformed_xyz[item].tolist()
+            return cell
+        return CellArray(
+            self.xyz[item], self.type[item], self.transformed_xyz[item]
+        )
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """
+    Spread the lower 21 bits of each uint64 value so there are two zero bits
+    between each of them, i.e. bit i moves to bit 3 * i.
+    """
+    values = values & np.uint64(0x1FFFFF)
+    for shift, mask in (
+        (32, 0x1F00000000FFFF),
+        (16, 0x1F0000FF0000FF),
+        (8, 0x100F00F00F00F00F),
+        (4, 0x10C30C30C30C30C3),
+        (2, 0x1249249249249249),
+    ):
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
 def match_cells(
     cells: List[Cell],
     other: List[Cell],
@@ -498,9 +776,17 @@ def match_cells(
             "An instance of match_cells is already running in this "
             "thread. Try running again once it completes"
         )
+    if not len(cells) or not len(other):
+        # nothing to match
+        return list(range(len(cells))), [], list(range(len(other)))
+
     c1 = to_numpy_pos(cells)
     c2 = to_numpy_pos(other)
 
+    if len(cells) == 1 or len(other) == 1:
+        # the optimal match of a single cell is just its nearest neighbour
+        return _match_single_cell(c1, c2, threshold)
+
     # c1 must be smaller or equal in length than c2
     flip = len(cells) > len(other)
     if flip:
@@ -529,6 +815,40 @@ def match_cells(
     return missing_c1.tolist(), good_matches.tolist(), missing_c2.tolist()
 
 
+def _match_single_cell(
+    pos1: np.ndarray, pos2: np.ndarray, threshold: float
+) -> Tuple[List[int], List[List[int]], List[int]]:
+    """
+    Implements `match_cells` for the case where `pos1` or `pos2` has only one
+    point, by matching that point to its nearest point in the other array.
+    """
+    flip = len(pos1) != 1
+    if flip:
+        pos1, pos2 = pos2, pos1
+
+    # every point of pos2 is compared against the single point in pos1
+    dist2 = _matched_sq_distances(
+        pos2, pos1, np.zeros(len(pos2), dtype=np.int64)
+    )
+    if np.any(dist2 == np.inf):
+        raise ValueError("The distance between points is too large")
+    nearest = int(np.argmin(dist2))
+
+    if dist2[nearest] >= threshold * threshold:
+        missing_pos1 = [0]
+        good_matches = []
+        missing_pos2 = list(range(len(pos2)))
+    else:
+        missing_pos1 = []
+        good_matches = [[0, nearest]]
+        missing_pos2 = [i for i in range(len(pos2)) if i != nearest]
+
+    if flip:
+        missing_pos1, missing_pos2 = missing_pos2, missing_pos1
+        good_matches = [[j, i] for i, j in good_matches]
+    return missing_pos1, good_matches, missing_pos2
+
+
 # terrible hack. But you can't pass arbitrary objects to a njit function. But,
 # it can access global variables and run them in objmode. So pass the progress
 # updater to match_points via this global variable and function. We make it
@@ -545,7 +865,7 @@ def __compare_progress(n: int = 1) -> None:
         __progress_update.updater(n)
 
 
-@njit
+@njit(cache=True)
 def _find_pairs_sorted(
     pos1: np.ndarray, pos2: np.ndarray
 ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -677,11 +997,94 @@ def _find_identical_points(
     return unpaired1_indices, unpaired2_indices, paired_indices
 
 
-@njit
+# fastmath flags for the distance kernels. "nnan" and "ninf" are left out
+# because we explicitly check for infinite distances, and "afn" because the
+# sqrt of the distance is used as the matching cost
+_FASTMATH = {"nsz", "arcp", "contract", "reassoc"}
+
+# below this many columns, the overhead of starting the threads (on every
+# step of the inner loop) is larger than the time saved by relaxing the
+# columns in parallel. A parallel step costs ~2-3 us more than a serial one,
+# and relaxing a column takes ~2.5 ns, so even with 2 threads it only pays
+# off for several thousand columns
+_PARALLEL_MIN_COLS = 10000
+
+
+def _relax_columns_impl(
+    pos1: np.ndarray,
+    pos2: np.ndarray,
+    row_cur: int,
+    col: int,
+    threshold: float,
+    potentials_rows: np.ndarray,
+    potentials_cols: np.ndarray,
+    min_to: np.ndarray,
+    prev_col_for_col: np.ndarray,
+    col_used: np.ndarray,
+    dist_is_inf: np.ndarray,
+) -> None:
+    """
+    One step of `_optimize_pairs`. For every column of `pos2` that is not
+    used, computes the reduced cost of the edge from `row_cur` and updates
+    `min_to` and `prev_col_for_col` in place if it's smaller.
+
+    Each column is independent, so this is compiled in a serial and a
+    parallel version. Raising is not allowed in a parallel loop, so instead
+    `dist_is_inf` is set for each column and the caller checks it.
+    """
+    have_threshold = threshold != np.inf
+    threshold2 = threshold * threshold
+    n_dims = pos1.shape[1]
+
+    for col_i in prange(pos2.shape[0]):
+        if not col_used[col_i]:
+            if n_dims == 3:
+                # the common (x, y, z) case, written out so it's unrolled
+                dx = pos1[row_cur, 0] - pos2[col_i, 0]
+                dy = pos1[row_cur, 1] - pos2[col_i, 1]
+                dz = pos1[row_cur, 2] - pos2[col_i, 2]
+                dist2 = dx * dx + dy * dy + dz * dz
+            else:
+                dist2 = 0.0
+                for i in range(n_dims):
+                    d = pos1[row_cur, i] - pos2[col_i, i]
+                    dist2 += d * d
+            dist_is_inf[col_i] = dist2 == np.inf
+
+            # the cost must be the actual distance (a sum of squared
+            # distances has a different optimum), but the threshold can be
+            # checked on the squared distance to skip the sqrt for far pairs
+            if have_threshold and dist2 > threshold2:
+                dist = threshold
+            else:
+                dist = math.sqrt(dist2)
+
+            cur = dist - potentials_rows[row_cur] - potentials_cols[col_i]
+            if cur < min_to[col_i]:
+                min_to[col_i] = cur
+                prev_col_for_col[col_i] = col
+
+
+_relax_columns = njit(fastmath=_FASTMATH)(_relax_columns_impl)
+_relax_columns_parallel = njit(parallel=True, fastmath=_FASTMATH)(
+    _relax_columns_impl
+)
+
+
+def _should_relax_in_parallel(n_cols: int) -> bool:
+    """
+    Whether `_optimize_pairs` should relax `n_cols` columns in parallel.
+    With a single thread, the parallel version only adds overhead.
+    """
+    return n_cols >= _PARALLEL_MIN_COLS and get_num_threads() > 1
+
+
+@njit(cache=True)
 def _optimize_pairs(
     pos1: np.ndarray,
     pos2: np.ndarray,
     threshold: float,
+    relax_in_parallel: bool = False,
 ) -> np.ndarray:
     """
     Implements `match_points` using
@@ -703,6 +1106,9 @@ def _optimize_pairs(
         It'll still show up in the matching, but it will have the least
         priority for a match because that match will not reduce the overall
         cost across all points.
+    relax_in_parallel : bool, optional. Defaults to False.
+        Whether to update the reduced costs of the columns in parallel. See
+        `_should_relax_in_parallel`.
 
     Returns
     -------
@@ -723,8 +1129,6 @@ def _optimize_pairs(
     pos1 = pos1.astype(np.float64)
     pos2 = pos2.astype(np.float64)
 
-    have_threshold = threshold != np.inf
-
     potentials_rows = np.zeros(n_rows)
     potentials_cols = np.zeros(n_cols + 1)
     assignment_row = np.full(n_cols + 1, -1, dtype=np.int_)
@@ -733,6 +1137,10 @@ def _optimize_pairs(
     prev_col_for_col = np.empty(n_cols + 1, dtype=np.int_)
     # whether col is in use
     col_used = np.zeros(n_cols + 1, dtype=np.bool_)
+    # whether the distance from the current row to col is infinite
+    dist_is_inf = np.zeros(n_cols + 1, dtype=np.bool_)
+    # entering objmode is expensive, so only update progress every ~1% rows
+    progress_step = max(1, n_rows // 100)
 
     # assign row-th match
     for row in range(n_rows):
@@ -750,29 +1158,42 @@ def _optimize_pairs(
             delta = np.inf
             col_next = -1
 
+            # update the reduced costs of all unused columns (can be done in
+            # parallel) and then find the column with the smallest one
+            if relax_in_parallel:
+                _relax_columns_parallel(
+                    pos1,
+                    pos2,
+                    row_cur,
+                    col,
+                    threshold,
+                    potentials_rows,
+                    potentials_cols,
+                    min_to,
+                    prev_col_for_col,
+                    col_used,
+                    dist_is_inf,
+                )
+            else:
+                _relax_columns(
+                    pos1,
+                    pos2,
+                    row_cur,
+                    col,
+                    threshold,
+                    potentials_rows,
+                    potentials_cols,
+                    min_to,
+                    prev_col_for_col,
+                    col_used,
+                    dist_is_inf,
+                )
             for col_i in range(n_cols):
                 if not col_used[col_i]:
-                    # use sqrt to match threshold which is in actual distance
-                    dist = 0.0
-                    for i in range(pos1.shape[1]):
-                        dist += math.pow(pos1[row_cur, i] - pos2[col_i, i], 2)
-                    dist = math.sqrt(dist)
-                    if dist == np.inf:
+                    if dist_is_inf[col_i]:
                         raise ValueError(
                             "The distance between points is too large"
                         )
-                    if have_threshold and dist > threshold:
-                        dist = threshold
-
-                    cur = (
-                        dist
-                        - potentials_rows[row_cur]
-                        - potentials_cols[col_i]
-                    )
-                    if cur < min_to[col_i]:
-                        min_to[col_i] = cur
-                        prev_col_for_col[col_i] = col
-
                     if min_to[col_i] < delta:
                         delta = min_to[col_i]
                         col_next = col_i
@@ -794,8 +1215,13 @@ def _optimize_pairs(
             assignment_row[col] = assignment_row[col_i]
             col = col_i
 
+        if (row + 1) % progress_step == 0:
+            with objmode():
+                __compare_progress(progress_step)
+
+    if n_rows % progress_step:
         with objmode():
-            __compare_progress()
+            __compare_progress(n_rows % progress_step)
 
     # compute match from assignment
     matches = np.empty(n_rows, dtype=np.int64)
@@ -877,7 +1303,9 @@ def match_points(
 
     if not pre_match:
         # do optimization on full inputs
-        return _optimize_pairs(pos1, pos2, threshold)
+        return _optimize_pairs(
+            pos1, pos2, threshold, _should_relax_in_parallel(pos2.shape[0])
+        )
 
     # extract the indices of zero-pairs and remaining points
     unpaired1_indices, unpaired2_indices, paired_indices = (
@@ -898,7 +1326,9 @@ def match_points(
     pos2 = pos2[unpaired2_indices]
     n_rows = pos1.shape[0]
 
-    matches = _optimize_pairs(pos1, pos2, threshold)
+    matches = _optimize_pairs(
+        pos1, pos2, threshold, _should_relax_in_parallel(pos2.shape[0])
+    )
 
     # map extracted
     full_matches = np.empty(n_rows + len(paired_indices), dtype=np.int64)
@@ -910,7 +1340,46 @@ def match_points(
     return full_matches
 
 
-@njit
+@njit(cache=True, fastmath=_FASTMATH)
+def _matched_sq_distances(
+    pos1: np.ndarray, pos2: np.ndarray, matches: np.ndarray
+) -> np.ndarray:
+    """
+    Returns the squared euclidean distance between each point in `pos1` and
+    its match in `pos2`, i.e. between `pos1[i]` and `pos2[matches[i]]`.
+
+    The subtraction, square and sum are done in a single pass, without
+    allocating any `NxK` temporary arrays.
+    """
+    n_dims = pos1.shape[1]
+    dist2 = np.empty(pos1.shape[0], dtype=np.float64)
+    for i in range(pos1.shape[0]):
+        j = matches[i]
+        total = 0.0
+        for k in range(n_dims):
+            d = pos1[i, k] - pos2[j, k]
+            total += d * d
+        dist2[i] = total
+    return dist2
+
+
+@njit(cache=True)
+def _merge_sorted(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Merges the two sorted 1D arrays into one sorted array in O(N)."""
+    merged = np.empty(len(a) + len(b), dtype=a.dtype)
+    i = 0
+    j = 0
+    for k in range(len(merged)):
+        if j == len(b) or (i < len(a) and a[i] <= b[j]):
+            merged[k] = a[i]
+            i += 1
+        else:
+            merged[k] = b[j]
+            j += 1
+    return merged
+
+
+@njit(cache=True)
 def analyze_point_matches(
     pos1: np.ndarray,
     pos2: np.ndarray,
@@ -970,27 +1439,30 @@ def analyze_point_matches(
         missing_pos2: 1d array of all the indices of pos2 that found no match
             in pos1 (sorted).
     """
-    # indices and mask on indices
-    pos2_n = len(pos2)
-    pos2_i = np.arange(pos2_n)
-    pos2_unmatched = np.ones(pos2_n, dtype=np.bool_)
-    # those in pos2 who have a match in pos1
+    # mask of pos2 who have no match in pos1
+    pos2_unmatched = np.ones(len(pos2), dtype=np.bool_)
     pos2_unmatched[matches] = False
-    # all the pos2 that have no matches from pos1
-    missing_pos2 = pos2_i[pos2_unmatched]
+    # all the pos2 that have no matches from pos1 (sorted)
+    missing_pos2 = np.flatnonzero(pos2_unmatched)
 
     # repackage matches so the first column is the pos1 idx and 2nd column is
     # the corresponding pos2 index
     matches_indices = np.stack((np.arange(len(pos1)), matches), axis=1)
 
-    dist = np.sqrt(np.sum(np.square(pos1 - pos2[matches, :]), axis=1))
-    too_large = dist >= threshold
+    if threshold == np.inf:
+        # no match can be too far, so skip computing the distances
+        too_large = np.zeros(len(pos1), dtype=np.bool_)
+    else:
+        # compare the squared distance to avoid a sqrt per match
+        dist2 = _matched_sq_distances(pos1, pos2, matches)
+        too_large = dist2 >= threshold * threshold
     bad_matches = matches_indices[too_large, :]
-    good_matches = matches_indices[np.logical_not(too_large), :]
+    good_matches = matches_indices[~too_large, :]
 
     missing_pos1 = bad_matches[:, 0]
-    # more missing for pos2 for those above threshold
-    missing_pos2 = np.concatenate((missing_pos2, bad_matches[:, 1]))
-    missing_pos2 = np.sort(missing_pos2)
+    if len(bad_matches):
+        # more missing for pos2 for those above threshold. missing_pos2 is
+        # already sorted, so only sort the (usually few) bad ones and merge
+        missing_pos2 = _merge_sorted(missing_pos2, np.sort(bad_matches[:, 1]))
 
     return missing_pos1, good_matches, missing_pos2
@@ -0,0 +1,146 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import requests
+
+from brainglobe_utils.citation.fetch import fetch_from_github, yaml_str_to_dict
+
+if TYPE_CHECKING:
+    from brainglobe_utils.citation.repositories import Repository
+
+# Environment variable that overrides the default cache directory
+CACHE_DIR_ENV_VAR = "BRAINGLOBE_CITATION_CACHE"
+# Cached citation information younger than this (in seconds) is used without
+# contacting GitHub at all.
+CACHE_TTL = 24 * 60 * 60
+
+
+def get_cache_dir() -> Path:
+    """
+    Directory in which cached citation information is stored.
+
+    This is the directory named by the BRAINGLOBE_CITATION_CACHE
+    environment variable if it is set, otherwise
+    ~/.brainglobe/citation_cache. It is looked up on each call, so the
+    environment variable can be changed at any time.
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".brainglobe" / "citation_cache"
+
+
+def _cache_file(repo: "Repository", cache_dir: Path) -> Path:
+    """
+    Location of the cache file for the repository's citation file.
+    """
+    key = f"{repo.org}-{repo.name}-{repo.cff_branch}-{repo.cff_loc}"
+    return cache_dir / (key.replace("/", "_") + ".json")
+
+
+def _read_cache(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read a cache entry, returning None if it is missing or unreadable.
+    """
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache(path: Path, entry: Dict[str, Any]) -> None:
+    """
+    Write a cache entry. Failing to write the cache is not an error,
+    the citation information will simply be fetched again next time.
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            # Dates parsed from the yaml are stored as their string form,
+            # which is how they are formatted into citations anyway.
+            json.dump(entry, f, default=str)
+    except (OSError, ValueError):
+        pass
+
+
+def get_citation_info(
+    repo: "Repository",
+    cache_dir: Optional[Path] = None,
+    ttl: float = CACHE_TTL,
+    refresh: bool = False,
+) -> Dict[str, Any]:
+    """
+    Read citation information for a repository, using an on-disk cache.
+
+    Parsed citation files are stored as JSON, along with the ETag and
+    Last-Modified headers of the response they were parsed from.
+    Cache entries younger than ttl are returned directly. Older entries
+    are revalidated with a conditional request, and are only re-fetched
+    and re-parsed if the file on GitHub has changed. If GitHub cannot
+    be reached, a stale cache entry is returned instead.
+
+    Parameters
+    ----------
+    repo : Repository
+        Repository to read the citation information of.
+    cache_dir : Path, optional
+        Directory in which cached citation information is stored. If None,
+        the directory returned by get_cache_dir is used.
+    ttl : float, default = CACHE_TTL
+        Age (in seconds) below which a cache entry is used without
+        revalidating it.
+    refresh : bool, default = False
+        If True, revalidate the cache entry regardless of its age.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The citation information of the repository.
+    """
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    path = _cache_file(repo, cache_dir)
+    cached = _read_cache(path)
+
+    if (
+        cached is not None
+        and not refresh
+        and time.time() - path.stat().st_mtime < ttl
+    ):
+        return cached["info"]
+
+    headers = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = fetch_from_github(
+            repo.org, repo.name, repo.cff_loc, repo.cff_branch, headers=headers
+        )
+    except (RuntimeError, requests.RequestException):
+        if cached is None:
+            raise
+        return cached["info"]
+
+    if response.status_code == 304 and cached is not None:
+        # Unchanged on GitHub, so restart the TTL of the cached entry.
+        path.touch()
+        return cached["info"]
+
+    info = yaml_str_to_dict(response.text)
+    _write_cache(
+        path,
+        {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "info": info,
+        },
+    )
+    return info
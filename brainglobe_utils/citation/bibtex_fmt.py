@@ -1,10 +1,17 @@
-import inspect
-import sys
 from string import ascii_letters, digits
-from typing import Any, ClassVar, Dict
+from typing import Any, ClassVar, Dict, Type
 
 from brainglobe_utils.citation.format import Format
 
+# Classes derived from BibTexEntry, indexed by the entry type they support.
+# Populated as each class is defined.
+_ENTRY_TYPES: Dict[str, Type["BibTexEntry"]] = {}
+
+# Translation table deleting the characters permitted in citation keys
+_REMOVE_CITE_KEY_CHARACTERS = str.maketrans(
+    "", "", ascii_letters + digits + "_-:"
+)
+
 
 class BibTexEntry(Format):
     """
@@ -35,6 +42,26 @@ class BibTexEntry(Format):
     author_separator: ClassVar[str] = " and "
     cite_key: str
 
+    # Line template for each field, built once per entry type
+    _field_templates: ClassVar[Dict[str, str]] = {}
+    # Template for all of the required field lines, which are always
+    # written. Takes the indent followed by the value of each field.
+    _required_template: ClassVar[str] = ""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._field_templates = {
+            field: f'{field} = "{{}}",\n'
+            for field in getattr(cls, "required", [])
+            + getattr(cls, "optional", [])
+        }
+        cls._required_template = "".join(
+            f'{{0}}{field} = "{{{i}}}",\n'
+            for i, field in enumerate(getattr(cls, "required", []), start=1)
+        )
+        # Register the class as the writer for its entry type
+        _ENTRY_TYPES[cls.entry_type()] = cls
+
     @classmethod
     def validate_citation_key(cls, key: str) -> bool:
         """
@@ -49,9 +76,8 @@ class BibTexEntry(Format):
 
         and no others.
         """
-        bad_characters = key.lower()
-        for valid_character in ascii_letters + digits + "_-:":
-            bad_characters = bad_characters.replace(valid_character, "")
+        # Remove all of the permitted characters in a single pass
+        bad_characters = key.translate(_REMOVE_CITE_KEY_CHARACTERS)
 
         if bad_characters:
             # Some characters in the string provided are not permitted,
@@ -66,10 +92,6 @@ class BibTexEntry(Format):
         warn_on_not_used: bool = False,
     ) -> None:
         """ """
-        # So we don't delete information that we may need in other places
-        # (C++ memory sharing rights plz Python)
-        information = information.copy()
-
         # Add the citation key if provided,
         # or use the default otherwise
         if self.validate_citation_key(cite_key):
@@ -88,9 +110,13 @@ class BibTexEntry(Format):
                 "Attempting to read reference of type"
                 f" {information['type']} into {self.entry_type()}"
             )
-            # Remove type field from information dict,
-            # so we don't try to assign it to a field later.
-            information.pop("type")
+            # Drop the type field, so we don't try to assign it to a field
+            # later. The information passed in is left untouched.
+            information = {
+                key: value
+                for key, value in information.items()
+                if key != "type"
+            }
 
         super().__init__(information, warn_on_not_used=warn_on_not_used)
 
@@ -101,30 +127,28 @@ class BibTexEntry(Format):
         Generate a string that encodes the reference, in preparation for
         writing to an output format.
         """
-        output_string = f"@{self.entry_type()}{{{self.cite_key},\n"
-
-        # Tracks current indentation level
-        indent_level = 1
+        lines = [f"@{self.entry_type()}{{{self.cite_key},\n"]
 
         # Required fields are guaranteed to exist
-        for req_field in self.required:
-            output_string += (
-                self.indent_character * indent_level
-                + f'{req_field} = "{getattr(self, req_field)}",\n'
+        lines.append(
+            self._required_template.format(
+                self.indent_character,
+                *(getattr(self, req_field) for req_field in self.required),
             )
+        )
 
         # Optional fields may be skipped
         for opt_field in self.optional:
-            if getattr(self, opt_field):
-                output_string += (
-                    self.indent_character * indent_level
-                    + f'{opt_field} = "{getattr(self, opt_field)}",\n'
+            value = getattr(self, opt_field)
+            if value:
+                lines.append(
+                    self.indent_character
+                    + self._field_templates[opt_field].format(value)
                 )
 
-        indent_level -= 1
-        output_string += "}"
+        lines.append("}")
 
-        return output_string
+        return "".join(lines)
 
 
 class Article(BibTexEntry):
@@ -178,10 +202,10 @@ class Software(BibTexEntry):
     ]
 
 
-def supported_bibtex_entry_types() -> Dict[str, BibTexEntry]:
+def supported_bibtex_entry_types() -> Dict[str, Type[BibTexEntry]]:
     """
-    Create a dict of all the classes in this module that can be used
-    to write a bibtex reference of a particular entry type.
+    Create a dict of all the classes derived from BibTexEntry that can be
+    used to write a bibtex reference of a particular entry type.
 
     keys are the entry type as it will appear in the .tex entry.
     values are the corresponding derived class to use when writing a
@@ -193,16 +217,6 @@ def supported_bibtex_entry_types() -> Dict[str, BibTexEntry]:
         Dict of classes derived from BibTexEntry that can handle entry
         types, indexed by the entry type they support.
     """
-    this_module = sys.modules[__name__]
-
-    dict_of_formats: Dict[str, BibTexEntry] = {
-        cls.entry_type(): cls
-        for cls in (
-            getattr(this_module, name)
-            for name, _ in inspect.getmembers(this_module, inspect.isclass)
-            if name != "BibTexEntry" and name != "Format"
-        )
-        if issubclass(cls, BibTexEntry)
-    }
-
-    return dict_of_formats
+    # The classes register themselves when defined, so there is no need to
+    # inspect this module. Return a copy so the registry can't be modified.
+    return dict(_ENTRY_TYPES)
@@ -1,7 +1,7 @@
 import sys
 from argparse import ArgumentParser
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 from warnings import warn
 
 from brainglobe_utils.citation.bibtex_fmt import (
@@ -10,6 +10,7 @@ from brainglobe_utils.citation.bibtex_fmt import (
 )
 from brainglobe_utils.citation.repositories import (
     all_citable_repositories,
+    read_citation_info_concurrently,
     unique_repositories_from_tools,
 )
 from brainglobe_utils.citation.text_fmt import TextCitation
@@ -27,6 +28,7 @@ def cite(
     cite_software: bool = False,
     newline_separations: int = 2,
     warn_on_unused_info: bool = False,
+    refresh: bool = False,
 ) -> str:
     """
     Provide citation(s) for the BrainGlobe tool(s) that the user has supplied.
@@ -54,6 +56,9 @@ def cite(
     warn_on_unused_info: bool, default = False
         If True, information parsed from the yaml-content that is not used by
         the citation format will be flagged to the user on output.
+    refresh: bool, default = False
+        If True, check GitHub for changes to the citation information of
+        each tool, rather than using recently cached information.
 
     Returns
     -------
@@ -72,12 +77,21 @@ def cite(
 
     # unique_repos is now a set of all the repositories that we need to cite
     # so we just need to gather all the citations we need
-    cite_string = ""
+    references = []
+    separator = "\n" * newline_separations
+
+    # Information is yielded as soon as each fetch is done, so that
+    # references can be written out while the remaining fetches are in
+    # progress.
+    all_citation_info = read_citation_info_concurrently(
+        unique_repos, refresh=refresh
+    )
 
-    for repo in unique_repos:
-        # Fetch citation information from repository
-        citation_info = repo.read_citation_info()
+    # Look up the supported entry types once, rather than once per reference
+    if format == "bibtex":
+        bibtex_entry_types = supported_bibtex_entry_types()
 
+    for repo, citation_info in all_citation_info:
         # Some formats are citation-type agnostic, others are not
         # Attempt to read this key here, and set the value to None
         # if it's not present.
@@ -124,9 +138,7 @@ def cite(
             # Cite this repository in the desired format
             if format == "bibtex":
                 try:
-                    citation_class = supported_bibtex_entry_types()[
-                        citation_type
-                    ]
+                    citation_class = bibtex_entry_types[citation_type]
                 except KeyError:
                     raise ValueError(
                         f"Bibtex entries require a supported Bibtex entry type"
@@ -140,9 +152,17 @@ def cite(
                     warn_on_not_used=warn_on_unused_info,
                 )
 
-        # Append the reference to the string we are generating
+        # Append the reference to those we are generating
         repo_reference = reference_instance.generate_ref_string()
-        cite_string += f"{repo_reference}" + "\n" * newline_separations
+        references.append(repo_reference)
+        references.append(separator)
+
+        # Without an output file, show each reference as soon as it's ready
+        if outfile is None:
+            sys.stdout.write(repo_reference + separator)
+            sys.stdout.flush()
+
+    cite_string = "".join(references)
 
     # Upon looping over each of the repositories, we should be ready to dump
     # the output to the requested location.
@@ -150,12 +170,53 @@ def cite(
         # Write output to file
         with open(Path(outfile), "w") as output_file:
             output_file.write(cite_string)
-    else:
-        sys.stdout.write(cite_string)
 
     return cite_string
 
 
+def _resolve_format(fmt: Optional[str], output_file: Optional[str]) -> str:
+    """
+    Resolve the citation format to write from the format and output file
+    passed to the command-line interface.
+
+    The extension of the output file takes precedence over the format.
+    Without either, the text format is used.
+
+    Raises
+    ------
+    RuntimeError
+        If the output file extension or the format is not supported, or if
+        an output file without an extension is given without a format.
+    """
+    extension = Path(output_file).suffix if output_file is not None else ""
+
+    # If there is an extension, infer the format from it.
+    if extension:
+        if extension[1:] not in EXTENSION_TO_FORMAT:
+            raise RuntimeError(
+                f"brainglobe-cite does not support writing {extension} files."
+            )
+        return EXTENSION_TO_FORMAT[extension[1:]]
+
+    if fmt is None:
+        if output_file is not None:
+            raise RuntimeError(
+                "You have not provided a file extension nor citation "
+                "format to write. You must provide one of these."
+            )
+        # Use default value as neither argument was provided
+        return "text"
+
+    if fmt not in FORMAT_TO_EXTENSION:
+        if output_file is None:
+            raise RuntimeError(f"Output format {fmt} is not supported.")
+        raise RuntimeError(
+            f"{fmt} format is not supported, and your output file "
+            "does not provide an implicit format."
+        )
+    return fmt
+
+
 class BrainGlobeParser(ArgumentParser):
     """
     Overwrite argparse default behaviour to have usage errors
@@ -196,6 +257,15 @@ def cli() -> None:
         help="Print out when citation information is omitted by "
         "the chosen citation format.",
     )
+    parser.add_argument(
+        "-r",
+        "--refresh",
+        action="store_true",
+        help="Check for updated citation information, rather than using "
+        "recently cached information. The cache is stored in "
+        "~/.brainglobe/citation_cache, or in the directory set by the "
+        "BRAINGLOBE_CITATION_CACHE environment variable.",
+    )
     parser.add_argument(
         "-o",
         "--output-file",
@@ -246,48 +316,8 @@ def cli() -> None:
         parser.print_help()
         sys.exit(1)
 
-    # Pass default values if available
-    fmt = getattr(arguments, "format")
-    output_file = getattr(arguments, "output_file")
-    extension = None
-
-    if output_file is None:
-        # With no output file, we cannot infer the format from it.
-        # So either use the one that was provided if it is supported,
-        # or use the default if it was also omitted
-        if fmt is not None and fmt not in FORMAT_TO_EXTENSION:
-            raise RuntimeError(f"Output format {fmt} is not supported.")
-        elif fmt is None:
-            # Use default value as this argument was also not provided
-            fmt = "text"
-    else:
-        # Output file provided - resolve path based on OS.
-        output_file = Path(output_file)
-        extension = output_file.suffix
-
-        # If there was an extension, then infer the format.
-        # This will overwrite the fmt argument.
-        if extension in EXTENSION_TO_FORMAT:
-            fmt = EXTENSION_TO_FORMAT[extension]
-        elif not extension:
-            if fmt is None:
-                # No extension provided, and no format for the citation
-                # provided. Throw error.
-                raise RuntimeError(
-                    "You have not provided a file extension nor citation "
-                    "format to write. You must provide one of these."
-                )
-            elif fmt not in FORMAT_TO_EXTENSION:
-                # Format must be supported to allow writing
-                raise RuntimeError(
-                    f"{fmt} format is not supported, and your output file "
-                    "does not provide an implicit format."
-                )
-        else:
-            # This is an extension that we don't support
-            raise RuntimeError(
-                f"brainglobe-cite does not support writing {extension} files."
-            )
+    output_file = arguments.output_file
+    fmt = _resolve_format(arguments.format, output_file)
 
     # Invoke API function
     cite(
@@ -296,5 +326,6 @@ def cli() -> None:
         outfile=output_file,
         cite_software=arguments.software_citations,
         warn_on_unused_info=arguments.warn_unused,
+        refresh=arguments.refresh,
     )
     sys.exit(0)
@@ -1,9 +1,18 @@
-from typing import Dict
+from typing import Dict, Optional
 
 import requests
-from yaml import safe_load
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "https://raw.githubusercontent.com"
+# Time (in seconds) to wait for GitHub to respond before giving up
+TIMEOUT = 10
+# Shared session, so that connections to GitHub are reused between fetches.
+# The pool holds enough connections for the fetches cite() makes at once.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=16),
+)
 
 
 def fetch_from_github(
@@ -11,6 +20,7 @@ def fetch_from_github(
     repo: str,
     file: str = "CITATION.cff",
     branch: str = "main",
+    headers: Optional[Dict[str, str]] = None,
 ) -> requests.Response:
     """
     Fetches the content of a file hosted on GitHub,
@@ -28,11 +38,16 @@ def fetch_from_github(
         Path to the file from the repository root.
     branch : str, default = main
         Branch to fetch the file from.
+    headers : Dict[str, str], optional
+        Additional headers to send with the request, for example to make
+        the request conditional on the file having changed.
 
     Returns
     -------
     requests.Response
         The response containing the file contents as text.
+        If conditional headers were sent and the file is unchanged, this
+        is a 304 (Not Modified) response with no content.
 
     Raises
     ------
@@ -42,7 +57,7 @@ def fetch_from_github(
     """
     url = f"{BASE_URL}/{user}/{repo}/{branch}/{file}"
 
-    r = requests.get(url)
+    r = SESSION.get(url, headers=headers, timeout=TIMEOUT)
 
     if not r.ok:
         raise RuntimeError(
@@ -57,4 +72,7 @@ def yaml_str_to_dict(text: str) -> Dict[str, str]:
     """
     Cast a string of text in yaml syntax to a Python dictionary.
     """
+    # yaml is only needed when a citation file is actually parsed
+    from yaml import safe_load
+
     return safe_load(text)
@@ -1,5 +1,5 @@
 import warnings
-from typing import Any, ClassVar, Dict, List, Union
+from typing import Any, ClassVar, Dict, FrozenSet, List, Union
 
 
 class Format:
@@ -38,6 +38,13 @@ class Format:
     required: ClassVar[List[str]]
     optional: ClassVar[List[str]]
 
+    # Schema built once per format from the required and optional fields:
+    # the required fields, the attribute each field is stored in, and the
+    # default (None) value of each optional attribute.
+    _required_set: ClassVar[FrozenSet[str]] = frozenset()
+    _key_to_attr: ClassVar[Dict[str, str]] = {}
+    _optional_defaults: ClassVar[Dict[str, None]] = {}
+
     # mypy type-hints
     authors: Union[str, Dict[str, str], List[Dict[str, str]]]
 
@@ -50,20 +57,34 @@ class Format:
         """
         return cls.__name__.lower()
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        required = getattr(cls, "required", [])
+        optional = getattr(cls, "optional", [])
+        cls._required_set = frozenset(required)
+        cls._key_to_attr = {
+            key: key.replace("-", "_") for key in required + optional
+        }
+        cls._optional_defaults = {
+            key.replace("-", "_"): None for key in optional
+        }
+
     def __init__(
         self,
         information: Dict[str, Any],
         warn_on_not_used: bool = False,
     ) -> None:
         """ """
-        # So we don't delete information that we may need in other places
-        # (C++ memory sharing rights plz Python)
-        information = information.copy()
+        # Optional fields should be set to None so that checks against
+        # them produce nothing and evaluate to False
+        vars(self).update(self._optional_defaults)
 
         # Add all the information we need
+        key_to_attr = self._key_to_attr
         for key, value in information.items():
-            if key in self.required or key in self.optional:
-                setattr(self, key.replace("-", "_"), value)
+            attr = key_to_attr.get(key)
+            if attr is not None:
+                setattr(self, attr, value)
             elif warn_on_not_used:
                 warnings.warn(
                     f"The key {key} is not used for entries of type "
@@ -72,16 +93,13 @@ class Format:
                 )
 
         # Check that all required information is populated
-        for required_field in self.required:
-            if not hasattr(self, required_field):
-                raise KeyError(
-                    f"Did not receive value for required key: {required_field}"
-                )
-        # Optional fields should be set to None so that checks against
-        # them produce nothing and evaluate to False
-        for optional_field in self.optional:
-            if not hasattr(self, optional_field.replace("-", "_")):
-                setattr(self, optional_field.replace("-", "_"), None)
+        if not self._required_set <= information.keys():
+            for required_field in self.required:
+                if required_field not in information:
+                    raise KeyError(
+                        "Did not receive value for required key: "
+                        f"{required_field}"
+                    )
 
         if hasattr(self, "authors"):
             self._prepare_authors_field()
@@ -109,19 +127,21 @@ class Format:
             self.authors = f"{forename} {surname}"
         # Multiple authors will be read in as a list of dictionaries
         elif isinstance(self.authors, list):
-            all_authors = []
-            for author_info in self.authors:
-                if not isinstance(author_info, dict):
-                    raise TypeError(
-                        "Expected individual author entry to be "
-                        "a dictionary, but it was "
-                        f"{type(author_info).__name__}: {author_info}"
-                    )
-                else:
-                    surname = author_info["family-names"]
-                    forename = author_info["given-names"]
-                    all_authors.append(f"{forename} {surname}")
-            self.authors = self.author_separator.join(all_authors)
+            if not all(isinstance(author, dict) for author in self.authors):
+                author_info = next(
+                    author
+                    for author in self.authors
+                    if not isinstance(author, dict)
+                )
+                raise TypeError(
+                    "Expected individual author entry to be "
+                    "a dictionary, but it was "
+                    f"{type(author_info).__name__}: {author_info}"
+                )
+            self.authors = self.author_separator.join(
+                f"{author['given-names']} {author['family-names']}"
+                for author in self.authors
+            )
         # Unrecognised read format, abort
         else:
             raise TypeError(
@@ -136,6 +156,8 @@ class Format:
         in the given format.
 
         This method will be overwritten by the derived class that
-        manages the format.
+        manages the format. Implementations should collect the parts of
+        the reference in a list and join them once at the end, rather
+        than repeatedly concatenating strings.
         """
         pass
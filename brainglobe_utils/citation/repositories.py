@@ -1,11 +1,29 @@
-import inspect
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Set
-
-import requests
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-from brainglobe_utils.citation.fetch import fetch_from_github, yaml_str_to_dict
+# Maximum number of citation files to fetch concurrently
+MAX_FETCH_WORKERS = 16
+
+# Prefix that is dropped from repository names to give another alias
+_PREFIX = "brainglobe"
+# Characters that are deemed interchangeable in tool aliases
+_INTERCHANGEABLE = "-_ "
+# For each interchangeable character, a table replacing the others with it
+_INTERCHANGE_TABLES = tuple(
+    str.maketrans({other: char for other in _INTERCHANGEABLE if other != char})
+    for char in _INTERCHANGEABLE
+)
 
 
 @dataclass
@@ -53,13 +71,20 @@ class Repository:
     cff_branch: str = "main"
     cff_loc: str = "CITATION.cff"
     org: str = "brainglobe"
+    _aliases_lower: FrozenSet[str] = field(
+        init=False, repr=False, compare=False
+    )
+    _url: str = field(init=False, repr=False, compare=False)
+    _citation_info: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def url(self) -> str:
         """
         URL to the repository as hosted on GitHub.
         """
-        return f"https://github.com/{self.org}/{self.name}"
+        return self._url
 
     def __contains__(self, alias: str) -> bool:
         """
@@ -69,7 +94,7 @@ class Repository:
 
         Comparison is case-insensitive for added protection.
         """
-        return alias.lower() in [name.lower() for name in self.tool_aliases]
+        return alias.lower() in self._aliases_lower
 
     def __eq__(self, other: "Repository") -> bool:
         """
@@ -94,7 +119,9 @@ class Repository:
         Run the following post-init checks:
 
         - self.tool_aliases is a set, or can be immediately cast to one.
-        - The repository actually exists and is reachable.
+
+        No network requests are made; whether the repository exists is only
+        checked when its citation information is read.
 
         And ensure the following behaviour is adhered to:
 
@@ -119,49 +146,39 @@ class Repository:
             # Strings cast to sets via str -> list -> set, so account for this
             self.tool_aliases = set([self.tool_aliases])
 
-        # Check repository actually exists
-        ping_site = requests.get(self.url)
-        if not ping_site.ok:
-            if ping_site.status_code == 404:
-                # Site not found, so repository does not exist
-                raise ValueError(
-                    f"Repository {self.org}/{self.name} does not exist"
-                    " (got 404 response)"
-                )
-            else:
-                raise ValueError(
-                    f"Could not reach {self.url} successfully (non 404 status)"
-                )
-
-        # These characters are deemed interchangeable for the purposes of
-        # supplying and referring to aliases.
-        interchangeable = ["-", "_", " "]
-
         # Can always refer to yourself by repository name
         if self.name not in self.tool_aliases:
             self.tool_aliases.add(self.name)
 
-        # If our name starts with the 'brainglobe' prefix, add another
-        # alias that drops this prefix.
-        for char in interchangeable:
-            if self.name.startswith(f"brainglobe{char}"):
-                self.tool_aliases.add(
-                    self.name.removeprefix(f"brainglobe{char}")
-                )
+        # If our name starts with the 'brainglobe' prefix, followed by one
+        # of the interchangeable characters, add another alias that drops
+        # this prefix.
+        prefix_length = len(_PREFIX)
+        if (
+            self.name.startswith(_PREFIX)
+            and len(self.name) > prefix_length
+            and self.name[prefix_length] in _INTERCHANGEABLE
+        ):
+            self.tool_aliases.add(self.name[prefix_length + 1 :])
 
         # Ensure that hyphens, dashes, and spaces are interchangeable
-        # when referring to tool aliases
+        # when referring to tool aliases, by adding the variant of each alias
+        # that uses only one of the characters.
         # So we don't iterate over a growing set
         original_tool_aliases = self.tool_aliases.copy()
-        # For each interchangeable character
-        for char in interchangeable:
-            replacements = [c for c in interchangeable if c is not char]
-            for alias in original_tool_aliases:
-                for replacement_char in replacements:
-                    proposed_equivalent_alias = alias.replace(
-                        char, replacement_char
-                    )
-                    self.tool_aliases.add(proposed_equivalent_alias)
+        for table in _INTERCHANGE_TABLES:
+            self.tool_aliases.update(
+                alias.translate(table) for alias in original_tool_aliases
+            )
+
+        # The url is used to compare and hash repositories, so build it once.
+        # Strings cache their own hash, so hashing it again is cheap too.
+        self._url = f"https://github.com/{self.org}/{self.name}"
+
+        # Lower-cased aliases, for case-insensitive lookups
+        self._aliases_lower = frozenset(
+            alias.lower() for alias in self.tool_aliases
+        )
 
         return
 
@@ -171,15 +188,86 @@ class Repository:
         """
         return self.url
 
-    def read_citation_info(self) -> Dict[str, Any]:
+    def read_citation_info(self, refresh: bool = False) -> Dict[str, Any]:
         """
         Read citation information from the repository into a dictionary.
+
+        Citation information is cached on disk, so repeated reads only
+        fetch the citation file again if it has changed on GitHub.
+        Once read, the information is also kept in memory, and the same
+        dictionary is returned by later calls.
+
+        Parameters
+        ----------
+        refresh : bool, default = False
+            If True, check GitHub for changes to the citation file even if
+            the information has been read or cached recently.
+
+        Raises
+        ------
+        ValueError
+            If the repository does not exist.
+        RuntimeError
+            If the citation file could not be fetched from the repository.
         """
-        cff_response = fetch_from_github(
-            self.org, self.name, self.cff_loc, self.cff_branch
-        )
+        if self._citation_info is not None and not refresh:
+            return self._citation_info
+
+        # Imported here so that code which never reads citation information,
+        # like listing the citable tools, doesn't pay to import requests.
+        from brainglobe_utils.citation._cache import get_citation_info
+        from brainglobe_utils.citation.fetch import SESSION, TIMEOUT
+
+        try:
+            self._citation_info = get_citation_info(self, refresh=refresh)
+        except RuntimeError:
+            # Fetch failed, so check the repository actually exists.
+            # Only the status is needed, so don't download the page.
+            response = SESSION.head(
+                self.url, allow_redirects=True, timeout=TIMEOUT
+            )
+            if response.status_code == 404:
+                raise ValueError(
+                    f"Repository {self.org}/{self.name} does not exist"
+                    " (got 404 response)"
+                ) from None
+            raise
+        return self._citation_info
+
+
+def read_citation_info_concurrently(
+    repos: Iterable[Repository], refresh: bool = False
+) -> Iterator[Tuple[Repository, Dict[str, Any]]]:
+    """
+    Read the citation information of several repositories at once.
 
-        return yaml_str_to_dict(cff_response.text)
+    Reading citation information is network-bound, so the citation files
+    of all the repositories are fetched and parsed on a pool of threads.
+
+    Parameters
+    ----------
+    repos: Iterable[Repository]
+        Repositories to read the citation information of.
+    refresh: bool, default = False
+        Passed to Repository.read_citation_info.
+
+    Returns
+    -------
+    Iterator[Tuple[Repository, Dict[str, Any]]]
+        Each repository and its citation information, in the order the
+        repositories were given. Pairs are yielded as soon as the
+        information for that repository is available.
+    """
+    repos = list(repos)
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(MAX_FETCH_WORKERS, len(repos)))
+    )
+    all_citation_info = executor.map(
+        lambda repo: repo.read_citation_info(refresh=refresh), repos
+    )
+    # All reads have been submitted, the threads exit once they are done
+    executor.shutdown(wait=False)
+    return zip(repos, all_citation_info)
 
 
 def unique_repositories_from_tools(
@@ -219,18 +307,15 @@ def unique_repositories_from_tools(
     # Infer the unique repositories from the list of tools
     for tool in tools:
         repo_to_cite: Repository = None
-        for repo in all_citable_repositories():
-            if tool in repo:
-                if repo_to_cite:
-                    # We have already found this alias in another repository,
-                    # Flag error
-                    raise ValueError(
-                        f"Multiple repositories match tool {tool}: "
-                        f"{repo_to_cite.name}, {repo.name}"
-                    )
-                else:
-                    # This is the first repository that might match the tool
-                    repo_to_cite = repo
+        matching_repos = _ALIAS_INDEX.get(tool.lower(), [])
+        if len(matching_repos) > 1:
+            # This alias is shared by more than one repository, flag error
+            raise ValueError(
+                f"Multiple repositories match tool {tool}: "
+                f"{matching_repos[0].name}, {matching_repos[1].name}"
+            )
+        elif matching_repos:
+            repo_to_cite = matching_repos[0]
         if repo_to_cite is None:
             # No repository matches this tool, throw error.
             raise RuntimeError(
@@ -325,16 +410,35 @@ cellfinder = Repository(
 # )
 
 
-def all_citable_repositories() -> List[Repository]:
+# All of the static repository instances above
+_CITABLE_REPOSITORIES: FrozenSet[Repository] = frozenset(
+    (
+        brainglobe_atlasapi,
+        brainglobe_heatmap,
+        brainglobe_meta,
+        brainglobe_napari_io,
+        brainglobe_segmentation,
+        brainglobe_space,
+        brainglobe_utils,
+        brainreg,
+        brainrender,
+        brainrender_napari,
+        cellfinder,
+    )
+)
+
+# Lower-cased tool alias -> repositories known by that alias
+_ALIAS_INDEX: Dict[str, List[Repository]] = {}
+for _repo in sorted(_CITABLE_REPOSITORIES):
+    for _alias in _repo._aliases_lower:
+        _ALIAS_INDEX.setdefault(_alias, []).append(_repo)
+
+
+def all_citable_repositories() -> FrozenSet[Repository]:
     """
-    Return a list of all citable brainglobe repositories.
+    Return a set of all citable brainglobe repositories.
 
-    That is, a list of all static repository instances defined in
+    That is, a set of all static repository instances defined in
     this submodule.
     """
-    return set(
-        obj
-        for _, obj in inspect.getmembers(
-            sys.modules[__name__], lambda x: isinstance(x, Repository)
-        )
-    )
+    return _CITABLE_REPOSITORIES
@@ -42,33 +42,31 @@ class TextCitation(Format):
         Generate a string that encodes the reference, in preparation for
         writing to an output format.
         """
-        output_string = ""
+        parts = []
 
         # Include optional sentence if provided
-        if getattr(self, "citation_sentence") is not None:
-            output_string += f"{getattr(self, 'citation_sentence')};\n"
+        if self.citation_sentence is not None:
+            parts.append(f"{self.citation_sentence};\n")
 
         # Required fields
-        output_string += f"{getattr(self, 'authors')} "
-        output_string += f"({getattr(self, 'year')}). "
-        output_string += f"{getattr(self, 'title')}.\n"
+        parts.append(f"{self.authors} ({self.year}). {self.title}.\n")
 
         # Optional information on final line
-        if getattr(self, "journal") is not None:
-            output_string += f"{getattr(self, 'journal')}, "
-        if getattr(self, "volume") is not None:
-            output_string += f"{getattr(self, 'volume')}"
-            if getattr(self, "issn") is not None:
-                output_string += f"({getattr(self, 'issn')}), "
-            elif getattr(self, "issue") is not None:
-                output_string += f"({getattr(self, 'issue')}), "
-        if getattr(self, "doi") is not None:
-            output_string += f"{getattr(self, 'doi')}, "
-        if getattr(self, "url") is not None:
-            output_string += f"{getattr(self, 'url')}, "
+        if self.journal is not None:
+            parts.append(f"{self.journal}, ")
+        if self.volume is not None:
+            parts.append(f"{self.volume}")
+            if self.issn is not None:
+                parts.append(f"({self.issn}), ")
+            elif self.issue is not None:
+                parts.append(f"({self.issue}), ")
+        if self.doi is not None:
+            parts.append(f"{self.doi}, ")
+        if self.url is not None:
+            parts.append(f"{self.url}, ")
 
         # Trim hanging comma if present
-        output_string = output_string.strip()
+        output_string = "".join(parts).strip()
         output_string = output_string.strip(",")
 
         return output_string
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from natsort import natsorted
 
 
@@ -18,9 +20,28 @@ def remove_empty_string(str_list):
     return list(filter(None, str_list))
 
 
-def unique_elements_lists(list_in):
-    """return the unique elements in a list"""
-    return list(dict.fromkeys(list_in))
+def unique_elements_lists(list_in, preserve_order=True):
+    """
+    Return the unique elements in a list.
+
+    Parameters
+    ----------
+    list_in : list
+        Input list.
+
+    preserve_order : bool, optional
+        If True, the unique elements are returned in order of first
+        appearance. Otherwise they are returned in arbitrary order, which is
+        faster. Default is True.
+
+    Returns
+    -------
+    list
+        The unique elements of the input list.
+    """
+    if preserve_order:
+        return list(dict.fromkeys(list_in))
+    return list(set(list_in))
 
 
 def check_unique_list(in_list, natural_sort=True):
@@ -43,13 +64,9 @@ def check_unique_list(in_list, natural_sort=True):
     list
         A list of any repeated values.
     """
-    unique = set(in_list)
-    repeated_items = []
-
-    for item in unique:
-        count = in_list.count(item)
-        if count > 1:
-            repeated_items.append(item)
+    repeated_items = [
+        item for item, count in Counter(in_list).items() if count > 1
+    ]
 
     if repeated_items:
         if natural_sort:
@@ -83,15 +100,14 @@ def common_member(a, b, natural_sort=True):
     list
         The list of common values.
     """
-    a_set = set(a)
-    b_set = set(b)
-    intersection = list(a_set.intersection(b_set))
-    if len(intersection) > 0:
-        result = True
-    else:
-        result = False
-
-    if natural_sort:
+    # Only build a set from the larger input, the smaller one is just
+    # checked against it.
+    if len(a) < len(b):
+        a, b = b, a
+    intersection = list(set(a).intersection(b))
+    result = len(intersection) > 0
+
+    if natural_sort and len(intersection) > 1:
         intersection = natsorted(intersection)
 
     return result, intersection
@@ -1,11 +1,43 @@
 import logging
 
 
+class _StartsWithFilter(logging.Filter):
+    """
+    Logging filter that rejects records whose message starts with the
+    given text.
+    """
+
+    def __init__(self, message):
+        super().__init__()
+        self.message = message
+
+    def filter(self, record):
+        return not record.getMessage().startswith(self.message)
+
+
 def suppress_specific_logs(logger, message):
+    """
+    Suppress log records from a logger if their message starts with the
+    given text.
+
+    Calling this more than once with the same logger and message only
+    adds a single filter.
+
+    Parameters
+    ----------
+    logger : str
+        Name of the logger.
+
+    message : str
+        Start of the messages to suppress.
+    """
     logger = logging.getLogger(logger)
 
-    class NoParsingFilter(logging.Filter):
-        def filter(self, record):
-            return not record.getMessage().startswith(message)
+    for log_filter in logger.filters:
+        if (
+            isinstance(log_filter, _StartsWithFilter)
+            and log_filter.message == message
+        ):
+            return
 
-    logger.addFilter(NoParsingFilter())
+    logger.addFilter(_StartsWithFilter(message))
@@ -7,7 +7,7 @@ def is_even(num):
 
     Parameters
     ----------
-    num : int
+    num : int or float
         Input number.
 
     Returns
@@ -25,10 +25,10 @@ def is_even(num):
             "Input number is 0. Evenness of 0 is not defined by this "
             "function."
         )
-    if num % 2:
-        return False
-    else:
-        return True
+    if isinstance(num, int):
+        return not num & 1
+    # e.g. floats and numpy scalars, which don't all support &
+    return num % 2 == 0
 
 
 def check_positive_float(value, none_allowed=True):
@@ -54,18 +54,7 @@ def check_positive_float(value, none_allowed=True):
     argparse.ArgumentTypeError
         If input value is invalid.
     """
-    ivalue = value
-    if ivalue is not None:
-        ivalue = float(ivalue)
-        if ivalue < 0:
-            raise argparse.ArgumentTypeError(
-                "%s is an invalid positive value" % value
-            )
-    else:
-        if not none_allowed:
-            raise argparse.ArgumentTypeError("%s is an invalid value." % value)
-
-    return ivalue
+    return _check_positive(value, float, none_allowed)
 
 
 def check_positive_int(value, none_allowed=True):
@@ -91,15 +80,22 @@ def check_positive_int(value, none_allowed=True):
     argparse.ArgumentTypeError
         If input value is invalid.
     """
-    ivalue = value
-    if ivalue is not None:
-        ivalue = int(ivalue)
-        if ivalue < 0:
-            raise argparse.ArgumentTypeError(
-                "%s is an invalid positive value" % value
-            )
-    else:
+    return _check_positive(value, int, none_allowed)
+
+
+def _check_positive(value, cast, none_allowed):
+    """
+    Cast the input value and check that it's positive, for
+    check_positive_float and check_positive_int.
+    """
+    if value is None:
         if not none_allowed:
             raise argparse.ArgumentTypeError("%s is an invalid value." % value)
+        return None
 
+    ivalue = cast(value)
+    if ivalue < 0:
+        raise argparse.ArgumentTypeError(
+            "%s is an invalid positive value" % value
+        )
     return ivalue
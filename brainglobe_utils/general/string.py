@@ -1,9 +1,13 @@
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 from natsort import natsorted
 
-from brainglobe_utils.general import list
+# Read buffer size for text files, larger than the default to reduce the
+# number of reads for long files (e.g. lists of image paths)
+_READ_BUFFER_SIZE = 2**16
 
 
 def get_text_lines(
@@ -42,14 +46,56 @@ def get_text_lines(
     str or list of str
         The nth line or lines.
     """
-    with open(file, encoding=encoding) as f:
-        lines = f.readlines()
-    if rstrip:
-        lines = [line.strip() for line in lines]
-    if remove_empty_lines:
-        lines = list.remove_empty_string(lines)
-    if sort:
-        lines = natsorted(lines)
+    # Files are only read again once they have been modified. Single lines
+    # are also taken from the cached lines, so reading several lines of the
+    # same file (one at a time) only reads it once.
+    file_stat = os.stat(file)
+    lines = _read_text_lines(
+        os.fspath(file),
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        rstrip,
+        sort,
+        remove_empty_lines,
+        encoding,
+    )
     if return_lines is not None:
-        lines = lines[return_lines]
+        return lines[return_lines]
+    # Return a new list, so the cached lines can't be modified
+    return list(lines)
+
+
+@lru_cache(maxsize=32)
+def _read_text_lines(
+    file: str,
+    mtime_ns: int,
+    size: int,
+    rstrip: bool,
+    sort: bool,
+    remove_empty_lines: bool,
+    encoding: str,
+) -> Tuple[str, ...]:
+    """
+    Read and process the lines of a text file, as for get_text_lines.
+
+    The modification time and size of the file are only used as part of
+    the cache key, so that modified files are read again.
+    """
+    with open(file, encoding=encoding, buffering=_READ_BUFFER_SIZE) as f:
+        lines = tuple(_process_lines(f, rstrip, remove_empty_lines))
+    if sort:
+        lines = tuple(natsorted(lines))
     return lines
+
+
+def _process_lines(
+    lines: Iterable[str], rstrip: bool, remove_empty_lines: bool
+) -> Iterator[str]:
+    """
+    Strip and filter lines lazily, in a single pass as they are read.
+    """
+    if rstrip:
+        lines = (line.strip() for line in lines)
+    if remove_empty_lines:
+        lines = filter(None, lines)
+    return iter(lines)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 
 
@@ -5,6 +7,8 @@ def get_bins(image_size, bin_sizes):
     """
     Given an image size, and bin size, return a list of the bin boundaries.
 
+    The bin boundaries are cached, so the returned arrays are read-only.
+
     Parameters
     ----------
     image_size : tuple of int or list of int
@@ -17,7 +21,24 @@ def get_bins(image_size, bin_sizes):
     list of np.ndarray
         List of arrays of bin boundaries
     """
+    image_size = tuple(image_size)
+    bin_sizes = tuple(bin_sizes)
+    # Equal sizes of different types (e.g. 2 and 2.0) give boundaries of
+    # different dtypes, so the types are part of the cache key
+    size_types = tuple(type(size) for size in image_size + bin_sizes)
+    return list(_get_bins(image_size, bin_sizes, size_types))
+
+
+@lru_cache(maxsize=32)
+def _get_bins(image_size, bin_sizes, size_types):
+    """
+    Cached bin boundaries, as a tuple of read-only arrays. size_types is
+    only used to key the cache.
+    """
     bins = []
     for dim in range(0, len(image_size)):
-        bins.append(np.arange(0, image_size[dim] + 1, bin_sizes[dim]))
-    return bins
+        dim_bins = np.arange(0, image_size[dim] + 1, bin_sizes[dim])
+        # Prevent the cached boundaries from being modified
+        dim_bins.setflags(write=False)
+        bins.append(dim_bins)
+    return tuple(bins)
@@ -2,8 +2,8 @@ from pathlib import Path
 from typing import Tuple, Union
 
 import numpy as np
-from scipy.ndimage import zoom
-from skimage.filters import gaussian
+from numba import njit, prange
+from scipy.ndimage import gaussian_filter, zoom
 
 from brainglobe_utils.general.system import ensure_directory_exists
 from brainglobe_utils.image.binning import get_bins
@@ -34,12 +34,238 @@ def rescale_array(source_array, target_array, order=1):
         t / s for s, t in zip(source_array.shape, target_array.shape)
     ]
 
+    if (
+        order == 1
+        and source_array.ndim == 3
+        and _supports_zoom_kernel(source_array.dtype)
+    ):
+        # Trilinear interpolation (e.g. of a downsampled atlas) is much
+        # faster with a specialised, parallel kernel
+        return _zoom_3d_linear(source_array, zoom_factors)
+
     # Use scipy's zoom function to rescale the array
     rescaled_array = zoom(source_array, zoom_factors, order=order)
 
     return rescaled_array
 
 
+def _supports_zoom_kernel(dtype):
+    """
+    Whether the numba zoom kernel can handle arrays of this dtype. Others
+    (e.g. float16, bool or non-native byte order) are left to scipy.
+    """
+    return dtype.isnative and (
+        dtype.kind in "iu" or dtype in (np.float32, np.float64)
+    )
+
+
+def _zoom_3d_linear(source_array, zoom_factors):
+    """
+    Zoom a 3D array with linear interpolation, giving the same result as
+    scipy.ndimage.zoom with order=1.
+
+    The output shape, the mapping of output to input coordinates, the
+    order of the floating point operations and the rounding of integer
+    values all match scipy.
+    """
+    output_shape = tuple(
+        int(round(size * factor))
+        for size, factor in zip(source_array.shape, zoom_factors)
+    )
+    coordinates = [
+        _linear_zoom_coordinates(in_size, out_size)
+        for in_size, out_size in zip(source_array.shape, output_shape)
+    ]
+    output = np.empty(output_shape, dtype=source_array.dtype)
+    _zoom_3d_linear_kernel(
+        np.ascontiguousarray(source_array),
+        output,
+        *coordinates[0],
+        *coordinates[1],
+        *coordinates[2],
+        source_array.dtype.kind in "iu",
+    )
+    return output
+
+
+def _linear_zoom_coordinates(
+    in_size: int, out_size: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    For each output index along one axis, the two neighbouring input
+    indices, the weight of the upper one, and whether the input coordinate
+    lies within the input array.
+
+    As with scipy, coordinates that fall (by rounding error) just outside
+    the input array are treated as being outside it.
+    """
+    if out_size > 1:
+        scale = (in_size - 1) / (out_size - 1)
+    else:
+        scale = 1.0
+    coordinates = np.arange(out_size) * scale
+    inside = (coordinates >= 0) & (coordinates <= in_size - 1)
+    lower = np.floor(coordinates)
+    weight = coordinates - lower
+    lower = np.minimum(lower.astype(np.intp), in_size - 1)
+    upper = np.minimum(lower + 1, in_size - 1)
+    return lower, upper, weight, inside
+
+
+@njit(cache=True)
+def _linear_weights(weight):
+    """
+    Weights of the lower and upper neighbours, calculated as scipy does.
+    """
+    lower_weight = 1 - weight
+    return lower_weight, 1 - lower_weight
+
+
+@njit(parallel=True, cache=True)
+def _zoom_3d_linear_kernel(
+    source,
+    output,
+    z_lower,
+    z_upper,
+    z_weight,
+    z_inside,
+    y_lower,
+    y_upper,
+    y_weight,
+    y_inside,
+    x_lower,
+    x_upper,
+    x_weight,
+    x_inside,
+    round_output,
+):
+    for i in prange(output.shape[0]):
+        z = (z_lower[i], z_upper[i])
+        wz = _linear_weights(z_weight[i])
+        for j in range(output.shape[1]):
+            y = (y_lower[j], y_upper[j])
+            wy = _linear_weights(y_weight[j])
+            for k in range(output.shape[2]):
+                if not (z_inside[i] and y_inside[j] and x_inside[k]):
+                    # Outside the input array, scipy uses the constant 0
+                    output[i, j, k] = 0
+                    continue
+                x = (x_lower[k], x_upper[k])
+                wx = _linear_weights(x_weight[k])
+                # Sum the corners in the same order as scipy
+                value = 0.0
+                for a in range(2):
+                    for b in range(2):
+                        for c in range(2):
+                            value += (
+                                source[z[a], y[b], x[c]]
+                                * wz[a]
+                                * wy[b]
+                                * wx[c]
+                            )
+                if round_output:
+                    # Round half away from zero, as scipy does
+                    value = value + 0.5 if value > 0 else value - 0.5
+                output[i, j, k] = value
+
+
+def _count_points_per_bin(
+    points: np.ndarray,
+    image_shape: Tuple[int, int, int],
+    bin_sizes: Tuple[int, int, int],
+) -> np.ndarray:
+    """
+    Count the points in each bin of the image, as np.histogramdd would with
+    the bins from get_bins.
+
+    The bins are uniform, so for integer bin sizes the bin of each point
+    can be found by division rather than searching the bin edges. As with
+    np.histogramdd, points on the last edge of each dimension are counted
+    in the last bin, and points outside the edges are ignored.
+    """
+    bins = get_bins(image_shape, bin_sizes)
+    last_edges = np.array([dim_bins[-1] for dim_bins in bins])
+    num_bins = tuple(len(dim_bins) - 1 for dim_bins in bins)
+
+    points = np.asarray(points)
+    in_range = np.all((points >= 0) & (points <= last_edges), axis=1)
+    points = points[in_range]
+    if all(float(size).is_integer() for size in bin_sizes):
+        bin_indices = (points // np.asarray(bin_sizes)).astype(np.intp)
+    else:
+        # Edges of non-integer bins aren't always exact multiples of the
+        # bin size, so search them, as np.histogramdd does
+        bin_indices = np.column_stack(
+            [
+                np.searchsorted(dim_bins, points[:, dim], side="right") - 1
+                for dim, dim_bins in enumerate(bins)
+            ]
+        ).astype(np.intp)
+    # Points on the last edge belong in the last bin
+    np.minimum(bin_indices, np.array(num_bins) - 1, out=bin_indices)
+
+    flat_indices = np.ravel_multi_index(bin_indices.T, num_bins)
+    counts = np.bincount(flat_indices, minlength=int(np.prod(num_bins)))
+    return counts.reshape(num_bins)
+
+
+def _mask_and_scale_to_16_bits(
+    image: np.ndarray, masking_image: np.ndarray
+) -> np.ndarray:
+    """
+    Mask a (non-negative) image, and scale it to 16 bits.
+
+    Gives the same result as mask_image_threshold followed by
+    scale_and_convert_to_16_bits, but reads the images twice (once to find
+    the maximum, once to mask and scale) rather than making a full-size
+    intermediate masked image.
+    """
+    # Calculate in the type mask_image_threshold would return
+    dtype = np.result_type(image, np.uint8)
+    flat_image = np.ascontiguousarray(image, dtype=dtype).reshape(-1)
+    flat_masking_image = np.ascontiguousarray(masking_image).reshape(-1)
+
+    image_max = dtype.type(_masked_max(flat_image, flat_masking_image))
+    if image_max == 0:
+        # Nothing to scale (an empty heatmap, or a mask that excludes all
+        # points), so leave scale_and_convert_to_16_bits to handle it.
+        return scale_and_convert_to_16_bits(
+            mask_image_threshold(image, masking_image)
+        )
+
+    # Scaling a floating point image stays in the same type, integer images
+    # are scaled as float64 (as numpy division would)
+    if dtype.kind == "f":
+        scale = dtype.type(2**16 - 1)
+    else:
+        image_max = np.float64(image_max)
+        scale = np.float64(2**16 - 1)
+
+    scaled = np.empty(np.shape(image), dtype=np.uint16)
+    _mask_and_scale_kernel(
+        flat_image, flat_masking_image, image_max, scale, scaled.reshape(-1)
+    )
+    return scaled
+
+
+@njit(parallel=True, cache=True)
+def _masked_max(image, masking_image):
+    result = 0
+    for i in prange(image.size):
+        if masking_image[i] > 0:
+            result = max(result, image[i])
+    return result
+
+
+@njit(parallel=True, cache=True)
+def _mask_and_scale_kernel(image, masking_image, image_max, scale, scaled):
+    for i in prange(image.size):
+        if masking_image[i] > 0:
+            scaled[i] = np.uint16((image[i] / image_max) * scale)
+        else:
+            scaled[i] = 0
+
+
 def heatmap_from_points(
     points: np.ndarray,
     image_resolution: float,
@@ -86,21 +312,29 @@ def heatmap_from_points(
         The generated heatmap as a NumPy array.
     """
 
-    bins = get_bins(image_shape, bin_sizes)
-    heatmap_array, _ = np.histogramdd(points, bins=bins)
+    heatmap_array = _count_points_per_bin(points, image_shape, bin_sizes)
     heatmap_array = heatmap_array.astype(np.uint16)
 
     if smoothing is not None:
         smoothing = int(round(smoothing / image_resolution))
-        heatmap_array = gaussian(heatmap_array, sigma=smoothing)
+        # As skimage.filters.gaussian would, but without first rescaling
+        # the counts to [0, 1] (which makes no difference once the heatmap
+        # is scaled to 16 bits)
+        heatmap_array = gaussian_filter(
+            heatmap_array,
+            sigma=smoothing,
+            output=np.float64,
+            mode="nearest",
+            truncate=4.0,
+        )
 
     if mask_image is not None:
         if mask_image.shape != heatmap_array.shape:
             mask_image = rescale_array(mask_image, heatmap_array)
 
-        heatmap_array = mask_image_threshold(heatmap_array, mask_image)
-
-    heatmap_array = scale_and_convert_to_16_bits(heatmap_array)
+        heatmap_array = _mask_and_scale_to_16_bits(heatmap_array, mask_image)
+    else:
+        heatmap_array = scale_and_convert_to_16_bits(heatmap_array)
 
     if output_filename is not None:
         ensure_directory_exists(Path(output_filename).parent)
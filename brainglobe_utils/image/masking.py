@@ -1,5 +1,8 @@
 import numpy as np
 
+# Number of elements masked at a time by mask_image_threshold
+_MASK_CHUNK_SIZE = 2**16
+
 
 def mask_image_threshold(image, masking_image, threshold=0):
     """
@@ -11,7 +14,8 @@ def mask_image_threshold(image, masking_image, threshold=0):
     image : np.ndarray
         Input image
     masking_image : np.ndarray
-        Image to base the mask on (same shape as image)
+        Image to base the mask on (same shape as image, or any shape that
+        broadcasts with it)
     threshold : int, optional
         Threshold to base the mask on
 
@@ -20,11 +24,35 @@ def mask_image_threshold(image, masking_image, threshold=0):
     np.ndarray
         Masked image
     """
-    masking_image = make_mask(masking_image, threshold=threshold)
-    return image * masking_image
+    image = np.asarray(image)
+    masking_image = np.asarray(masking_image)
+    shape = np.broadcast_shapes(image.shape, masking_image.shape)
+    # Mask into an output of the same type as image * make_mask(...)
+    masked = np.empty(shape, dtype=np.result_type(image, np.uint8))
+
+    if image.shape != shape or masking_image.shape != shape:
+        # Broadcast images can't be split into flat chunks without copying
+        # them to the full shape, so mask them in one go
+        np.multiply(image, masking_image > threshold, out=masked)
+        return masked
 
+    # Mask in chunks, so that the binary mask stays small (and in cache)
+    # rather than being the size of the whole image
+    flat_image = image.reshape(-1)
+    flat_masking_image = masking_image.reshape(-1)
+    flat_masked = masked.reshape(-1)
+    mask = np.empty(min(flat_image.size, _MASK_CHUNK_SIZE), dtype=bool)
+    for start in range(0, flat_image.size, _MASK_CHUNK_SIZE):
+        stop = min(start + _MASK_CHUNK_SIZE, flat_image.size)
+        chunk_mask = mask[: stop - start]
+        np.greater(flat_masking_image[start:stop], threshold, out=chunk_mask)
+        np.multiply(
+            flat_image[start:stop], chunk_mask, out=flat_masked[start:stop]
+        )
+    return masked
 
-def make_mask(masking_image, threshold=0):
+
+def make_mask(masking_image, threshold=0, out=None):
     """
     Given an image, and an optional threshold, returns a binary image that can
     be used as a mask.
@@ -36,13 +64,24 @@ def make_mask(masking_image, threshold=0):
     threshold : int, optional
         Optional threshold, default 0. Values above this are
         included in the mask. Values below this are not.
+    out : np.ndarray, optional
+        Array of type np.uint8, and the same shape as masking_image, to
+        write the mask into (e.g. to reuse it when masking many images).
+        If None, a new array is created.
 
     Returns
     -------
     np.ndarray
-        Binary mask
+        Binary mask, of type np.uint8
     """
-    mask = np.copy(masking_image)
-    mask[masking_image <= threshold] = 0
-    mask[masking_image > threshold] = 1
-    return mask
+    if out is None:
+        return np.greater(masking_image, threshold).view(np.uint8)
+
+    if out.dtype != np.uint8 or out.shape != np.shape(masking_image):
+        raise ValueError(
+            f"out must be a np.uint8 array of shape "
+            f"{np.shape(masking_image)}, not a {out.dtype} array of shape "
+            f"{out.shape}"
+        )
+    np.greater(masking_image, threshold, out=out.view(bool))
+    return out
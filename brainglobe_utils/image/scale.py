@@ -1,5 +1,8 @@
 import numpy as np
 
+# Number of elements normalised at a time by scale_and_convert_to_16_bits
+_SCALE_CHUNK_SIZE = 2**16
+
 
 def scale_to_16_bits(img):
     """
@@ -34,5 +37,18 @@ def scale_and_convert_to_16_bits(img):
     np.ndarray
         The normalised, 16 bit image
     """
-    img = scale_to_16_bits(img)
-    return img.astype(np.uint16, copy=False)
+    img = np.asarray(img)
+    img_max = img.max()
+    scaled = np.empty(img.shape, dtype=np.uint16)
+
+    # Normalise in chunks, so that the floating point intermediate stays
+    # small (and in cache) rather than being the size of the whole image.
+    # This gives exactly the same values as scale_to_16_bits.
+    flat_img = img.reshape(-1)
+    flat_scaled = scaled.reshape(-1)
+    for start in range(0, flat_img.size, _SCALE_CHUNK_SIZE):
+        stop = start + _SCALE_CHUNK_SIZE
+        chunk = np.divide(flat_img[start:stop], img_max)
+        chunk *= 2**16 - 1
+        flat_scaled[start:stop] = chunk
+    return scaled
@@ -1,5 +1,7 @@
 import os
 from pathlib import Path
+from xml.dom import minidom
+from xml.etree import ElementTree
 
 import pandas as pd
 import pytest
@@ -166,6 +168,48 @@ def test_cells_to_xml(tmp_path, xml_path):
     assert cells == cell_io.get_cells(str(tmp_cells_out_path))
 
 
+@pytest.mark.parametrize(
+    "xml",
+    [
+        '<a><b/><c x="1 /&gt;">t &gt; /&gt;</c><d><e/><f>1</f></d></a>',
+        "<mixed>  lead <in/>tail</mixed>",
+    ],
+    ids=["leaf text", "mixed content"],
+)
+def test_pretty_xml_matches_minidom(xml):
+    """
+    Test that pretty_xml gives the same bytes as minidom's toprettyxml,
+    including for empty elements and mixed content.
+    """
+    elem = ElementTree.fromstring(xml)
+    expected = minidom.parseString(
+        ElementTree.tostring(elem, "utf-8")
+    ).toprettyxml(indent="  ", encoding="UTF-8")
+    assert cell_io.pretty_xml(elem) == expected
+
+
+def test_make_xml_matches_pretty_xml(xml_path):
+    """
+    Test that make_xml, which writes the xml text directly, gives the same
+    bytes as pretty printing the equivalent element tree.
+    """
+    cells = cell_io.get_cells(xml_path)
+    root = ElementTree.Element("CellCounter_Marker_File")
+    image_properties = ElementTree.SubElement(root, "Image_Properties")
+    ElementTree.SubElement(image_properties, "Image_Filename").text = (
+        "placeholder.tif"
+    )
+    marker_data = ElementTree.SubElement(root, "Marker_Data")
+    ElementTree.SubElement(marker_data, "Current_Type").text = "1"
+    for cell_type, type_cells in cell_io.make_type_dict(cells).items():
+        marker_type = ElementTree.SubElement(marker_data, "Marker_Type")
+        ElementTree.SubElement(marker_type, "Type").text = str(cell_type)
+        for cell in type_cells:
+            marker_type.append(cell.to_xml_element())
+
+    assert cell_io.make_xml(cells, "  ") == cell_io.pretty_xml(root)
+
+
 @pytest.mark.parametrize("artifact_keep", [True, False])
 def test_cells_to_xml_artifacts_keep(
     cells_with_artifacts, tmp_path, artifact_keep
@@ -6,6 +6,7 @@ import numpy as np
 import psutil
 import pytest
 import tifffile
+from skimage import transform
 
 from brainglobe_utils.IO.image import load, save, to_tiffs, utils
 
@@ -212,6 +213,89 @@ def test_tiff_sequence_diff_shape(tmp_path, array_3d, load_parallel):
         load.load_any(tmp_path, load_parallel=load_parallel)
 
 
+@pytest.mark.parametrize("n_threads", [1, 3])
+def test_load_from_paths_sequence(
+    array_3D_as_2d_tiffs_path, array_3d, n_threads
+):
+    """
+    Test that a tiff sequence is loaded correctly (with the planes along
+    the last axis), with or without multiple threads
+    """
+    paths = sorted(array_3D_as_2d_tiffs_path.iterdir())
+    volume = load.load_from_paths_sequence(paths, n_threads=n_threads)
+    np.testing.assert_array_equal(volume, np.moveaxis(array_3d, 0, 2))
+
+    save.to_tiff(np.ones((3, 3)), paths[-1])
+    with pytest.raises(utils.ImageIOLoadException):
+        load.load_from_paths_sequence(paths, n_threads=n_threads)
+
+
+def scaled_planes(array, scaling_factor):
+    """
+    Scale each plane of a (z, y, x) array as when loading a tiff sequence,
+    and return them along the last axis with the dtype of the array.
+    """
+    return np.stack(
+        [
+            transform.rescale(
+                plane,
+                (scaling_factor, scaling_factor),
+                mode="constant",
+                preserve_range=True,
+                anti_aliasing=True,
+            )
+            for plane in array
+        ],
+        axis=2,
+    ).astype(array.dtype)
+
+
+@pytest.mark.parametrize("n_threads", [1, 3])
+def test_load_from_paths_sequence_scaling_dtype(
+    array_3D_as_2d_tiffs_path, array_3d, n_threads
+):
+    """
+    Test that scaled planes are loaded with the dtype of the images, rather
+    than the float dtype they are scaled to
+    """
+    paths = sorted(array_3D_as_2d_tiffs_path.iterdir())
+    volume = load.load_from_paths_sequence(
+        paths, x_scaling_factor=0.5, y_scaling_factor=0.5, n_threads=n_threads
+    )
+    assert volume.dtype == array_3d.dtype
+    np.testing.assert_array_equal(volume, scaled_planes(array_3d, 0.5))
+
+
+@pytest.mark.parametrize(
+    "fits_in_shared_memory",
+    [
+        pytest.param(True, id="shared memory"),
+        pytest.param(False, id="returned subsequences"),
+    ],
+)
+def test_threaded_load_from_sequence(
+    array_3D_as_2d_tiffs_path, array_3d, fits_in_shared_memory
+):
+    """
+    Test that a tiff sequence is loaded correctly by multiple processes,
+    and keeps the dtype of the images when scaled, whether or not the
+    volume fits in shared memory
+    """
+    paths = sorted(array_3D_as_2d_tiffs_path.iterdir())
+    with mock.patch(
+        "brainglobe_utils.IO.image.load._fits_in_shared_memory",
+        return_value=fits_in_shared_memory,
+    ):
+        volume = load.threaded_load_from_sequence(paths, n_free_cpus=0)
+        scaled_volume = load.threaded_load_from_sequence(
+            paths, x_scaling_factor=0.5, y_scaling_factor=0.5, n_free_cpus=0
+        )
+
+    np.testing.assert_array_equal(volume, np.moveaxis(array_3d, 0, 2))
+    assert scaled_volume.dtype == array_3d.dtype
+    np.testing.assert_array_equal(scaled_volume, scaled_planes(array_3d, 0.5))
+
+
 @pytest.mark.parametrize("use_path", [True, False], ids=["Path", "String"])
 def test_load_img_sequence_from_txt(txt_path, array_3d, use_path):
     """
@@ -18,6 +18,7 @@ from brainglobe_utils.brainreg.transform import (
     [
         (np.ones((132, 80, 114)), [[10, 10, 10], [10, 10, 10]], []),
         (np.ones((4, 4, 4)), np.atleast_3d([]), [[5, 5, 5], [6, 6, 6]]),
+        (np.ones((6, 6, 6)), [[10, 10, 10]], [[6, 6, 6]]),
     ],
 )
 def test_transform_points_from_downsampled_to_atlas_space(
@@ -30,6 +31,7 @@ def test_transform_points_from_downsampled_to_atlas_space(
     Test case for transforming points from downsampled space to atlas space.
     * check that deformation field of ones maps to 1,1,1*resolution
     * check that too small deformation field maps points to out-of-bounds
+    * check that only the points outside the deformation field are dropped
 
     Parameters
     ----------
@@ -57,3 +59,52 @@ def test_transform_points_from_downsampled_to_atlas_space(
     # all coordinates should be mapped to [1,1,1]*1mm/100um = [10,10,10]
     assert np.all(transformed_points == expected_transformed_points)
     assert points_out_of_bounds == expected_points_out_of_bounds
+
+
+@pytest.mark.parametrize(
+    ("interpolation", "expected_transformed_points"),
+    [("nearest", [[60, 60, 60]]), ("trilinear", [[75, 75, 75]])],
+)
+def test_transform_points_interpolation(
+    mocker, interpolation, expected_transformed_points
+):
+    """
+    Test that trilinear interpolation of a linear deformation field gives the
+    exact value between voxels, whereas nearest uses the closest voxel.
+    """
+    x, y, z = np.indices((4, 4, 4))
+    mocker.patch(
+        "brainglobe_utils.brainreg.transform.tifffile.imread",
+        side_effect=lambda _: x + 2 * y + 3 * z,
+    )
+    transformed_points, points_out_of_bounds = (
+        transform_points_from_downsampled_to_atlas_space(
+            downsampled_points=np.array([[1.5, 2.25, 0.5], [3.6, 0, 0]]),
+            atlas=mocker.Mock(resolution=(100, 100, 100)),
+            deformation_field_paths=["x.tif", "y.tif", "z.tif"],
+            interpolation=interpolation,
+        )
+    )
+    assert np.array_equal(transformed_points, expected_transformed_points)
+    assert points_out_of_bounds == [[4, 0, 0]]
+
+
+def test_transform_points_loaded_deformation_fields(mocker):
+    """
+    Test that already loaded deformation fields can be passed instead of
+    file paths, without reading any files.
+    """
+    imread = mocker.patch(
+        "brainglobe_utils.brainreg.transform.tifffile.imread"
+    )
+    deformation_fields = [np.full((8, 8, 8), value) for value in (1, 2, 3)]
+    transformed_points, points_out_of_bounds = (
+        transform_points_from_downsampled_to_atlas_space(
+            downsampled_points=np.array([[5, 5, 5], [6, 6, 6]]),
+            atlas=mocker.Mock(resolution=(100, 100, 100)),
+            deformation_field_paths=deformation_fields,
+        )
+    )
+    imread.assert_not_called()
+    assert np.array_equal(transformed_points, [[10, 20, 30], [10, 20, 30]])
+    assert points_out_of_bounds == []
@@ -1,5 +1,7 @@
 import math
 import os
+from collections import OrderedDict
+from xml.etree import ElementTree
 
 import numpy as np
 import pandas as pd
@@ -51,6 +53,44 @@ def test_pos_from_file_name(cubes_dir):
     assert natsorted(positions) == natsorted(positions_validate)
 
 
+def test_pos_from_file_name_case_and_repeats():
+    """
+    Test that axis letters are case-insensitive, and that the last position
+    given for an axis is used
+    """
+    assert cells.pos_from_file_name("pCellZ10Y522X392Ch0.tif") == [
+        392,
+        522,
+        10,
+    ]
+    assert cells.pos_from_file_name("x1_y2_z3_x4.tif") == [4, 2, 3]
+
+
+def test_pos_from_file_name_missing_axis():
+    """
+    Test that a filename without all of x, y and z raises an IndexError
+    """
+    with pytest.raises(IndexError):
+        cells.pos_from_file_name("pCellz10y522Ch0.tif")
+
+
+def test_pos_from_xml_marker():
+    """
+    Test that [x, y, z] positions can be extracted from xml markers, skipping
+    any missing or empty markers
+    """
+    marker = ElementTree.fromstring(
+        "<Marker><MarkerX>12</MarkerX><MarkerY>34</MarkerY>"
+        "<MarkerZ>5</MarkerZ></Marker>"
+    )
+    assert cells.pos_from_xml_marker(marker) == [12, 34, 5]
+
+    marker = ElementTree.fromstring(
+        "<Marker><MarkerX>12</MarkerX><MarkerY /></Marker>"
+    )
+    assert cells.pos_from_xml_marker(marker) == [12]
+
+
 def test_group_cells_by_z(
     xml_path, z_planes_validate, cell_numbers_in_groups_validate
 ):
@@ -70,14 +110,38 @@ def test_group_cells_by_z(
     assert cell_numbers_in_groups_test == cell_numbers_in_groups_validate
 
 
+def test_cell_array_group_by_z(xml_path):
+    """
+    Test that grouping a CellArray by z plane gives the same groups as
+    group_cells_by_z
+    """
+    cell_list = get_cells(xml_path)
+    cells_groups = cells.group_cells_by_z(cell_list)
+    index_groups = cells.CellArray.from_cells(cell_list).group_by_z()
+
+    assert list(index_groups) == sorted(cells_groups)
+    for plane, indices in index_groups.items():
+        assert [cell_list[i] for i in indices] == cells_groups[plane]
+
+
 @pytest.mark.parametrize(
     "cell_type, int_type",
     [
         ("cell", cells.Cell.CELL),
         ("no_cell", cells.Cell.ARTIFACT),
+        ("No_Cell", cells.Cell.ARTIFACT),
         (None, cells.Cell.UNKNOWN),
+        ("-1", cells.Cell.ARTIFACT),
+        (np.int64(2), cells.Cell.CELL),
+    ],
+    ids=[
+        "cell string",
+        "no_cell string",
+        "mixed case string",
+        "None",
+        "int string",
+        "numpy int",
     ],
-    ids=["cell string", "no_cell string", "None"],
 )
 def test_cell_type(cell_type, int_type):
     """
@@ -88,12 +152,37 @@ def test_cell_type(cell_type, int_type):
     assert cell.type == int_type
 
 
-def test_nan_cell_position():
+@pytest.mark.parametrize(
+    "pos",
+    [
+        [1, 2, 3],
+        (1, 2, 3),
+        np.array([1, 2, 3]),
+        {"x": 1, "y": 2, "z": 3},
+        OrderedDict(x=1, y=2, z=3),
+        "path/to/pCellz3y2x1Ch0.tif",
+        ElementTree.fromstring(
+            "<Marker><MarkerX>1</MarkerX><MarkerY>2</MarkerY>"
+            "<MarkerZ>3</MarkerZ></Marker>"
+        ),
+    ],
+    ids=["list", "tuple", "array", "dict", "dict subclass", "path", "xml"],
+)
+def test_cell_position_types(pos):
+    """
+    Test that a cell can be created from each supported type of position
+    """
+    cell = cells.Cell(pos, cells.Cell.CELL)
+    assert (cell.x, cell.y, cell.z) == (1, 2, 3)
+
+
+def test_nan_cell_position(caplog):
     """
-    Test that nan cell position is replaced with 1.
+    Test that nan cell position is replaced with 1, with a warning.
     """
     cell = cells.Cell([math.nan, 1, np.nan], cells.Cell.CELL)
     assert (cell.x, cell.y, cell.z) == (1, 1, 1)
+    assert "NaN position" in caplog.text
 
 
 @pytest.mark.parametrize(
@@ -231,3 +320,126 @@ def test_cells_to_np_cell_type():
         cells.to_numpy_pos(items, cells.Cell.CELL),
         [[3, 4, 5]],
     )
+
+
+def test_cell_ordering():
+    """
+    Test that cells are ordered by z, then y, then x position, and that
+    comparison to a non-cell object is not supported.
+    """
+    items = [
+        cells.Cell([3, 1, 2], cells.Cell.CELL),
+        cells.Cell([1, 2, 1], cells.Cell.CELL),
+        cells.Cell([2, 1, 2], cells.Cell.UNKNOWN),
+        cells.Cell([5, 1, 1], cells.Cell.CELL),
+    ]
+    assert [(c.x, c.y, c.z) for c in sorted(items)] == [
+        (5, 1, 1),
+        (1, 2, 1),
+        (2, 1, 2),
+        (3, 1, 2),
+    ]
+    assert not items[0] < items[0]
+    assert items[0] >= items[2]
+
+    with pytest.raises(TypeError):
+        items[0] < 1
+
+
+def test_cell_hash():
+    """
+    Test that equal cells hash the same, so duplicates are removed by a set,
+    and that untyped cells behave the same.
+    """
+    items = [
+        cells.Cell([1, 2, 3], cells.Cell.CELL),
+        cells.Cell([1, 2, 3], cells.Cell.CELL),
+        cells.Cell([1, 2, 3], cells.Cell.UNKNOWN),
+        cells.UntypedCell([1, 2, 3]),
+        cells.UntypedCell([1, 2, 3]),
+    ]
+    assert hash(items[0]) == hash(items[1])
+    assert len(set(items)) == 3
+
+    # slotted cells don't accept new attributes
+    with pytest.raises(AttributeError):
+        items[0].volume = 1
+    with pytest.raises(AttributeError):
+        items[3].volume = 1
+
+
+def test_cell_array():
+    """
+    Test that a CellArray round trips a list of cells, and that indexing
+    returns cells or filtered CellArrays.
+    """
+    items = [
+        cells.Cell([1, 2, 3], cells.Cell.CELL),
+        cells.Cell([4, 5, 6], cells.Cell.UNKNOWN),
+        cells.Cell([7, 8, 9], cells.Cell.CELL),
+    ]
+    items[1].soft_transform(x_scale=0.5)
+    cell_array = cells.CellArray.from_cells(items)
+
+    assert len(cell_array) == 3
+    np.testing.assert_array_equal(cell_array.xyz, cells.to_numpy_pos(items))
+    np.testing.assert_array_equal(cell_array.transformed_xyz[1], [2, 5, 6])
+    assert cell_array.to_cells() == items
+    assert cell_array[1].transformed_x == 2
+
+    only_cells = cell_array[cell_array.type == cells.Cell.CELL]
+    assert isinstance(only_cells, cells.CellArray)
+    assert only_cells.to_cells() == [items[0], items[2]]
+
+    empty = cells.CellArray.from_cells([])
+    assert len(empty) == 0
+    assert empty.xyz.shape == (0, 3)
+
+
+@pytest.mark.parametrize("integer", [True, False])
+def test_cell_array_transform(integer):
+    """
+    Test that transforming a CellArray matches transforming each cell.
+    """
+    items = [
+        cells.Cell([1, 2, 3], cells.Cell.CELL),
+        cells.Cell([4, 5, 7], cells.Cell.UNKNOWN),
+    ]
+    params = dict(
+        x_scale=0.5, y_scale=2, z_scale=1.5, x_offset=1, z_offset=-2.5
+    )
+    cell_array = cells.CellArray.from_cells(items)
+    cell_array.soft_transform(integer=integer, **params)
+    np.testing.assert_array_equal(cell_array.xyz, cells.to_numpy_pos(items))
+
+    cell_array.transform(integer=integer, **params)
+    for cell in items:
+        cell.transform(integer=integer, **params)
+    np.testing.assert_array_equal(cell_array.xyz, cells.to_numpy_pos(items))
+    np.testing.assert_array_equal(cell_array.transformed_xyz, cell_array.xyz)
+
+
+def test_cell_array_morton_order():
+    """
+    Test that cells are sorted by their interleaved x, y and z bits
+    """
+    rng = np.random.default_rng(0)
+    xyz = rng.integers(-20, 20, (50, 3))
+    cell_array = cells.CellArray(xyz)
+
+    def morton_code(position):
+        code = 0
+        for bit in range(6):
+            for axis in range(3):
+                code |= ((position[axis] >> bit) & 1) << (3 * bit + axis)
+        return code
+
+    offset_xyz = (xyz - xyz.min(axis=0)).tolist()
+    codes = [morton_code(position) for position in offset_xyz]
+    assert np.array_equal(
+        cell_array.morton_order(), np.argsort(codes, kind="stable")
+    )
+    assert len(cells.CellArray(np.empty((0, 3))).morton_order()) == 0
+
+    with pytest.raises(ValueError):
+        cells.CellArray([[0, 0, 0], [2**21, 0, 0]]).morton_order()
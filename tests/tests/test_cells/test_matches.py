@@ -148,6 +148,26 @@ def test_cell_matches_larger_cells(pre_match):
     assert [[0, 0], [1, 1], [3, 3], [4, 2]] == ab
 
 
+def test_cell_matches_empty():
+    a = as_cell([10, 20])
+    assert match_cells(a, []) == ([0, 1], [], [])
+    assert match_cells([], a) == ([], [], [0, 1])
+    assert match_cells([], []) == ([], [], [])
+
+
+@pytest.mark.parametrize("pre_match", [True, False])
+def test_cell_matches_single_cell(pre_match):
+    a = as_cell([20])
+    b = as_cell([5, 15, 25, 35])
+    assert match_cells(a, b, pre_match=pre_match) == ([], [[0, 1]], [0, 2, 3])
+    assert match_cells(b, a, pre_match=pre_match) == ([0, 2, 3], [[1, 0]], [])
+
+    a_, ab, b_ = match_cells(a, b, threshold=5, pre_match=pre_match)
+    assert a_ == [0]
+    assert not ab
+    assert b_ == [0, 1, 2, 3]
+
+
 @pytest.mark.parametrize("pre_match", [True, False])
 def test_cell_matches_threshold(pre_match):
     a = as_cell([10, 12, 100, 80])
@@ -283,3 +303,35 @@ def test_contains_no_identical_points(pre_match):
     b = np.array([[6, 7], [7, 1], [21, 10]])
     matching = match_points(a, b, pre_match=pre_match)
     assert np.array_equal(matching, [1, 0, 2])
+
+
+@pytest.mark.parametrize("threshold", [np.inf, 30])
+def test_optimize_pairs_parallel_matches_serial(threshold):
+    rng = np.random.default_rng(0)
+    a = rng.random((40, 3)) * 100
+    b = rng.random((50, 3)) * 100
+
+    serial = cell_utils._optimize_pairs(a, b, threshold, False)
+    parallel = cell_utils._optimize_pairs(a, b, threshold, True)
+    assert np.array_equal(serial, parallel)
+
+    b[10] = np.inf
+    with pytest.raises(ValueError):
+        cell_utils._optimize_pairs(a, b, threshold, True)
+
+
+@pytest.mark.parametrize(
+    "n_threads, n_cols, expected",
+    [
+        (1, 10 * cell_utils._PARALLEL_MIN_COLS, False),
+        (4, cell_utils._PARALLEL_MIN_COLS - 1, False),
+        (4, cell_utils._PARALLEL_MIN_COLS, True),
+    ],
+)
+def test_should_relax_in_parallel(monkeypatch, n_threads, n_cols, expected):
+    """
+    Test that columns are only relaxed in parallel for large inputs, and
+    never with a single thread.
+    """
+    monkeypatch.setattr(cell_utils, "get_num_threads", lambda: n_threads)
+    assert cell_utils._should_relax_in_parallel(n_cols) == expected
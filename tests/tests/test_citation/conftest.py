@@ -0,0 +1,14 @@
+import pytest
+
+from brainglobe_utils.citation._cache import CACHE_DIR_ENV_VAR
+
+
+@pytest.fixture(autouse=True)
+def citation_cache_dir(tmp_path, monkeypatch):
+    """
+    Store cached citation information in a temporary directory, rather
+    than in the user's home directory.
+    """
+    cache_dir = tmp_path / "citation_cache"
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(cache_dir))
+    return cache_dir
@@ -110,3 +110,22 @@ def test_generate_ref_string() -> None:
                 " when it should have been ignored."
             )
             assert expected_line not in intermediary_lines, error_line
+
+
+@pytest.mark.parametrize(
+    ["key", "valid"],
+    [
+        ("BrainGlobeReference", True),
+        ("Tyson_2022-a:b", True),
+        ("", True),
+        ("has space", False),
+        ("a11g00dt111n0w:(", False),
+        ("naïve", False),
+    ],
+)
+def test_validate_citation_key(key: str, valid: bool) -> None:
+    """
+    Check that only alphanumeric characters, '_', '-' and ':' are
+    accepted in citation keys.
+    """
+    assert Article.validate_citation_key(key) == valid
@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from brainglobe_utils.citation import _cache
+from brainglobe_utils.citation._cache import get_citation_info
+
+CFF_TEXT = "title: A tool\ndate-released: 2023-01-01\n"
+
+
+@pytest.fixture
+def repo():
+    return SimpleNamespace(
+        org="brainglobe",
+        name="brainglobe-utils",
+        cff_branch="main",
+        cff_loc="CITATION.cff",
+    )
+
+
+@pytest.fixture
+def mock_fetch(mocker):
+    response = mocker.Mock(
+        status_code=200, text=CFF_TEXT, headers={"ETag": '"abc"'}
+    )
+    return mocker.patch.object(
+        _cache, "fetch_from_github", return_value=response
+    )
+
+
+def test_citation_info_cached(tmp_path, repo, mock_fetch) -> None:
+    """
+    Test that citation information is fetched once, then read from the
+    cache while it is younger than the TTL.
+    """
+    info = get_citation_info(repo, cache_dir=tmp_path)
+    assert info["title"] == "A tool"
+    assert mock_fetch.call_count == 1
+
+    assert get_citation_info(repo, cache_dir=tmp_path) == {
+        "title": "A tool",
+        "date-released": "2023-01-01",
+    }
+    assert mock_fetch.call_count == 1
+
+    # Refreshing revalidates the entry regardless of its age
+    get_citation_info(repo, cache_dir=tmp_path, refresh=True)
+    assert mock_fetch.call_count == 2
+
+
+def test_citation_info_revalidated(tmp_path, repo, mock_fetch) -> None:
+    """
+    Test that stale cache entries are revalidated using their ETag, and
+    are returned if the citation file has not changed.
+    """
+    get_citation_info(repo, cache_dir=tmp_path)
+    (cache_file,) = tmp_path.iterdir()
+    os.utime(cache_file, (0, 0))
+
+    mock_fetch.return_value.status_code = 304
+    mock_fetch.return_value.text = ""
+    info = get_citation_info(repo, cache_dir=tmp_path)
+
+    assert info["title"] == "A tool"
+    assert mock_fetch.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+    # Revalidating the entry restarts its TTL
+    assert cache_file.stat().st_mtime > 0
+
+
+def test_citation_info_offline(tmp_path, repo, mock_fetch) -> None:
+    """
+    Test that stale cache entries are used if the fetch fails, and that
+    the error is raised if there is no cache entry to fall back on.
+    """
+    get_citation_info(repo, cache_dir=tmp_path)
+    mock_fetch.side_effect = RuntimeError("Bad request or response")
+
+    info = get_citation_info(repo, cache_dir=tmp_path, ttl=0)
+    assert info["title"] == "A tool"
+
+    with pytest.raises(RuntimeError, match="Bad request or response"):
+        get_citation_info(repo, cache_dir=tmp_path / "empty", ttl=0)
+
+
+def test_citation_cache_dir(
+    tmp_path, monkeypatch, repo, mock_fetch, citation_cache_dir
+) -> None:
+    """
+    Test that citation information is cached in the directory set by the
+    environment variable, and in ~/.brainglobe otherwise.
+    """
+    get_citation_info(repo)
+    assert len(list(citation_cache_dir.iterdir())) == 1
+
+    monkeypatch.delenv(_cache.CACHE_DIR_ENV_VAR)
+    monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+    assert _cache.get_cache_dir() == (
+        tmp_path / "home" / ".brainglobe" / "citation_cache"
+    )
+    get_citation_info(repo)
+    assert len(list(_cache.get_cache_dir().iterdir())) == 1
@@ -3,6 +3,8 @@ from typing import List
 
 import pytest
 
+from brainglobe_utils.citation.cite import _resolve_format
+
 
 def run_cite_brainglobe(*cli_args: str) -> subprocess.CompletedProcess:
     """
@@ -98,3 +100,21 @@ def test_catch_incompatible_args(error_msg: str, cli_args: List[str]) -> None:
         "cite-brainglobe correctly reports an error, "
         "but the reason is not the expected one."
     )
+
+
+@pytest.mark.parametrize(
+    "fmt, output_file, expected",
+    [
+        pytest.param(None, None, "text", id="Default format"),
+        pytest.param("bibtex", None, "bibtex", id="Format only"),
+        pytest.param(None, "refs.tex", "bibtex", id="Extension only"),
+        pytest.param("text", "refs.tex", "bibtex", id="Extension overrides"),
+        pytest.param("bibtex", "refs", "bibtex", id="No extension"),
+    ],
+)
+def test_resolve_format(fmt: str, output_file: str, expected: str) -> None:
+    """
+    Test that the format is inferred from the output file extension when
+    there is one, and taken from the format argument otherwise.
+    """
+    assert _resolve_format(fmt, output_file) == expected
@@ -96,6 +96,18 @@ class TestFormat:
         """
         Article(information=self.good_info)
 
+    def test_information_not_modified(self) -> None:
+        """
+        Test that the information used to construct an entry is left
+        untouched.
+        """
+        pass_info = {**self.good_info, "type": "article"}
+        original_info = pass_info.copy()
+
+        Article(pass_info)
+
+        assert pass_info == original_info
+
     def test_warn_on_unused_info(self) -> None:
         """
         Test that, when requested, warnings are thrown if information is
@@ -3,18 +3,21 @@ import pytest
 from brainglobe_utils.citation.repositories import (
     Repository,
     all_citable_repositories,
+    read_citation_info_concurrently,
     unique_repositories_from_tools,
 )
 
 
 def test_throw_on_bad_repo() -> None:
     """
-    Test that we cannot construct a repository that doesn't exist.
+    Test that we cannot read citation information from a repository that
+    doesn't exist, and that repositories are not checked on construction.
     """
+    repo = Repository("dont-exist", ["a", "b", "c"])
     with pytest.raises(
         ValueError, match="Repository brainglobe/dont-exist does not exist"
     ):
-        Repository("dont-exist", ["a", "b", "c"])
+        repo.read_citation_info()
 
     with pytest.raises(
         TypeError, match="Cannot convert input of type int to a set"
@@ -130,3 +133,50 @@ def test_automatic_alias_generation() -> None:
         "my alias" in meta_package.tool_aliases
         and "my-alias" in meta_package.tool_aliases
     ), "Interchangeable characters in custom aliases are not replaced."
+
+
+def test_aliases_unique() -> None:
+    """
+    Test that no tool alias is shared between two of our repositories,
+    and that every repository can be looked up case-insensitively by each
+    of its aliases.
+    """
+    for repo in all_citable_repositories():
+        for alias in repo.tool_aliases:
+            assert unique_repositories_from_tools(alias.upper()) == {repo}
+
+
+def test_citation_info_read_once(mocker) -> None:
+    """
+    Test that citation information is only read once per repository.
+    """
+    get_citation_info = mocker.patch(
+        "brainglobe_utils.citation._cache.get_citation_info",
+        return_value={"title": "BrainGlobe"},
+    )
+    repo = Repository("BrainGlobe", [])
+
+    assert repo.read_citation_info() == {"title": "BrainGlobe"}
+    assert repo.read_citation_info() == {"title": "BrainGlobe"}
+    get_citation_info.assert_called_once_with(repo, refresh=False)
+
+    # Refreshing reads the information again
+    repo.read_citation_info(refresh=True)
+    get_citation_info.assert_called_with(repo, refresh=True)
+
+
+def test_read_citation_info_concurrently(mocker) -> None:
+    """
+    Test that citation information is read for every repository, and is
+    returned in the order the repositories were given.
+    """
+    mocker.patch(
+        "brainglobe_utils.citation._cache.get_citation_info",
+        side_effect=lambda repo, refresh: {"title": repo.name},
+    )
+    repos = [Repository(name, []) for name in ("c", "a", "b")]
+
+    assert list(read_citation_info_concurrently(repos)) == [
+        (repo, {"title": repo.name}) for repo in repos
+    ]
+    assert list(read_citation_info_concurrently([])) == []
@@ -23,6 +23,10 @@ def test_unique_elements_list():
     list_in = [1, 2, 2, "a", "b", 1, "a", "dog"]
     unique_list = [1, 2, "a", "b", "dog"]
     assert list_tools.unique_elements_lists(list_in) == unique_list
+    assert sorted(
+        list_tools.unique_elements_lists(list_in, preserve_order=False),
+        key=str,
+    ) == sorted(unique_list, key=str)
 
 
 def test_check_unique_list():
@@ -30,6 +34,10 @@ def test_check_unique_list():
     assert (True, []) == list_tools.check_unique_list(a)
     repeating_list = [1, 2, 3, 3, "dog", "cat", "dog"]
     assert (False, [3, "dog"]) == list_tools.check_unique_list(repeating_list)
+    # Without sorting, repeated items are in order of first appearance
+    assert (False, ["dog", 3]) == list_tools.check_unique_list(
+        ["dog", 3, 3, "dog"], natural_sort=False
+    )
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,20 @@
+import logging
+
+from brainglobe_utils.general.logging import suppress_specific_logs
+
+
+def test_suppress_specific_logs(caplog):
+    logger_name = "brainglobe_utils.test_suppress_specific_logs"
+    suppress_specific_logs(logger_name, "Parsing")
+    suppress_specific_logs(logger_name, "Parsing")
+
+    logger = logging.getLogger(logger_name)
+    assert len(logger.filters) == 1
+
+    with caplog.at_level(logging.INFO, logger=logger_name):
+        logger.info("Parsing file")
+        logger.info("Loading file")
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Loading file"
+    ]
@@ -2,6 +2,7 @@ import random
 from argparse import ArgumentTypeError
 from random import randint
 
+import numpy as np
 import pytest
 
 from brainglobe_utils.general import numerical
@@ -16,6 +17,14 @@ def test_is_even():
     assert not numerical.is_even(odd_number)
 
 
+@pytest.mark.parametrize(
+    "num, expected",
+    [(4.0, True), (3.0, False), (np.float64(3.0), False), (np.int64(6), True)],
+)
+def test_is_even_non_int(num, expected):
+    assert numerical.is_even(num) == expected
+
+
 def test_check_positive_float():
     pos_val = randint(1, 1000) / 100
     neg_val = -randint(1, 1000) / 100
@@ -48,3 +48,40 @@ def test_get_string_lines(jabberwocky, jabberwocky_list):
         string.get_text_lines(jabberwocky, return_lines=8)
         == jabberwocky_list[8]
     )
+    assert (
+        string.get_text_lines(jabberwocky, return_lines=-1)
+        == jabberwocky_list[-1]
+    )
+    with pytest.raises(IndexError):
+        string.get_text_lines(jabberwocky, return_lines=len(jabberwocky_list))
+
+
+def test_get_string_lines_single_lines_cached(tmp_path):
+    """
+    Test that reading single lines of a file one at a time only reads the
+    file once.
+    """
+    text_file = tmp_path / "lines.txt"
+    text_file.write_text("a\nb\nc\n")
+
+    string.get_text_lines(text_file, return_lines=0)
+    misses = string._read_text_lines.cache_info().misses
+    assert string.get_text_lines(text_file, return_lines=2) == "c"
+    assert string._read_text_lines.cache_info().misses == misses
+
+
+def test_get_string_lines_modified(tmp_path):
+    """
+    Test that the lines of a file are read again once it has changed,
+    and that modifying the returned lines doesn't affect later calls.
+    """
+    text_file = tmp_path / "lines.txt"
+    text_file.write_text("b\na\n")
+
+    lines = string.get_text_lines(text_file)
+    assert lines == ["b", "a"]
+    lines.append("c")
+    assert string.get_text_lines(text_file) == ["b", "a"]
+
+    text_file.write_text("b\na\nc\n")
+    assert string.get_text_lines(text_file, sort=True) == ["a", "b", "c"]
@@ -1,11 +1,14 @@
 import os
 import platform
 import random
+import shlex
+import sys
 from pathlib import Path
 from random import shuffle
 from unittest.mock import Mock, patch
 
 import pytest
+from natsort import natsorted
 
 from brainglobe_utils.general import system
 from brainglobe_utils.general.exceptions import CommandLineInputError
@@ -106,6 +109,12 @@ def test_ensure_directory_exists(tmpdir):
     assert exist_dir_pathlib.exists()
     exist_dir_pathlib.rmdir()
 
+    # nested, and already existing
+    nested_dir = Path(tmpdir) / "parent" / "child"
+    system.ensure_directory_exists(nested_dir)
+    system.ensure_directory_exists(nested_dir)
+    assert nested_dir.is_dir()
+
 
 def test_get_sorted_file_paths(
     cubes_dir, jabberwocky, jabberwocky_sorted, sorted_cubes_dir
@@ -121,6 +130,11 @@ def test_get_sorted_file_paths(
         system.get_sorted_file_paths(cubes_dir, file_extension=".tif")
         == sorted_cubes_dir
     )
+    assert (
+        system.get_sorted_file_paths(cubes_dir, file_extension=".tif*")
+        == sorted_cubes_dir
+    )
+    assert system.get_sorted_file_paths(cubes_dir, file_extension=".txt") == []
 
     # test text file
     # specifying utf8, as written on linux
@@ -133,6 +147,20 @@ def test_get_sorted_file_paths(
         system.get_sorted_file_paths(shuffled[0])
 
 
+@pytest.mark.parametrize(
+    "paths",
+    [
+        ["img_10.tif", "img_02.tif", "img_01.tif"],
+        ["img_10.tif", "img_2.tif", "img_1.tif"],
+        ["b_1.tif", "a_2.tif", "a_1.tif"],
+        [Path("img_2.tif"), Path("img_1.tif")],
+        [],
+    ],
+)
+def test_natsorted_paths(paths):
+    assert system._natsorted_paths(paths) == natsorted(paths)
+
+
 def test_check_path_in_dir(jabberwocky, data_path):
     assert system.check_path_in_dir(jabberwocky, data_path / "general")
 
@@ -380,11 +408,77 @@ def test_delete_directory_contents(tmp_path):
     assert os.listdir(delete_dir) == []
 
 
+@pytest.mark.parametrize("progress", [True, False])
+def test_delete_directory_contents_threaded(tmp_path, progress):
+    delete_dir = tmp_path / "delete_dir"
+    os.mkdir(delete_dir)
+    for i in range(1001):
+        (delete_dir / f"file_{i}").touch()
+
+    system.delete_directory_contents(
+        delete_dir, progress=progress, n_threads=4
+    )
+    assert os.listdir(delete_dir) == []
+
+
 def write_file_single_size(directory, file_size):
     with open(os.path.join(directory, str(file_size)), "wb") as fout:
         fout.write(os.urandom(file_size))
 
 
+@pytest.mark.skipif(
+    platform.system() == "Windows",
+    reason="Commands are written for a POSIX shell",
+)
+def test_safe_execute_command(tmp_path):
+    log_file = tmp_path / "command.log"
+    error_file = tmp_path / "command.err"
+    python = shlex.quote(sys.executable)
+
+    for shell in (True, False):
+        system.safe_execute_command(
+            f"{python} -c 'print(\"hello world\")'",
+            log_file,
+            error_file,
+            shell=shell,
+        )
+        assert log_file.read_text().strip() == "hello world"
+
+        with pytest.raises(system.SafeExecuteCommandError):
+            system.safe_execute_command(
+                f"{python} -c 'raise SystemExit(1)'",
+                log_file,
+                error_file,
+                shell=shell,
+            )
+        with pytest.raises(system.SafeExecuteCommandError):
+            system.safe_execute_command(
+                "brainglobe_missing_program",
+                log_file,
+                error_file,
+                shell=shell,
+            )
+
+
+@pytest.mark.skipif(
+    platform.system() == "Windows",
+    reason="Commands are written for a POSIX shell",
+)
+def test_safe_execute_command_uses_shell_by_default(tmp_path):
+    """
+    Test that commands are run through the shell by default, so they can
+    use shell features such as environment variables and redirection.
+    """
+    log_file = tmp_path / "command.log"
+    output_file = tmp_path / "home.txt"
+
+    system.safe_execute_command(f"echo $HOME > {output_file}", log_file)
+    assert output_file.read_text().strip() == os.environ["HOME"]
+
+    system.safe_execute_command("echo $HOME | wc -c", log_file)
+    assert int(log_file.read_text()) > 1
+
+
 def test_check_path_exists(tmpdir):
     num = 10
     tmpdir = str(tmpdir)
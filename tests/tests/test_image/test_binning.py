@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 from brainglobe_utils.image import binning
 
@@ -17,3 +18,24 @@ def test_get_bins():
     assert (dim1_bins == bins[1]).all()
     assert (dim2_bins == bins[2]).all()
     assert (dim3_bins == bins[3]).all()
+
+
+def test_get_bins_cached():
+    bins = binning.get_bins([10, 10], [5, 2])
+    assert binning.get_bins((10, 10), (5, 2))[0] is bins[0]
+
+    # Cached boundaries can't be modified
+    with pytest.raises(ValueError):
+        bins[0][0] = 1
+
+
+def test_get_bins_float_sizes():
+    bins = binning.get_bins((10, 5), (2.5, 1.5))
+
+    assert np.array_equal(bins[0], np.arange(0, 11, 2.5))
+    assert np.array_equal(bins[1], np.arange(0, 6, 1.5))
+    # Float sizes aren't truncated, so don't share a cache entry with ints
+    assert binning.get_bins((10, 5), (2, 1))[0] is not bins[0]
+    # Equal int and float sizes give boundaries of their own dtype
+    assert binning.get_bins((10,), (2,))[0].dtype.kind == "i"
+    assert binning.get_bins((10,), (2.0,))[0].dtype.kind == "f"
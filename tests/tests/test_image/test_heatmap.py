@@ -1,8 +1,17 @@
 import numpy as np
 import pytest
+from scipy.ndimage import zoom
 from tifffile import imread
 
-from brainglobe_utils.image.heatmap import heatmap_from_points, rescale_array
+from brainglobe_utils.image.binning import get_bins
+from brainglobe_utils.image.heatmap import (
+    _count_points_per_bin,
+    _mask_and_scale_to_16_bits,
+    heatmap_from_points,
+    rescale_array,
+)
+from brainglobe_utils.image.masking import mask_image_threshold
+from brainglobe_utils.image.scale import scale_and_convert_to_16_bits
 
 
 @pytest.fixture
@@ -32,6 +41,59 @@ def test_rescale_array(mask_array):
     assert resized_array.shape == small_array.shape
 
 
+@pytest.mark.parametrize(
+    "dtype", [np.float64, np.float32, np.uint8, np.int16, np.uint16]
+)
+@pytest.mark.parametrize(
+    "source_shape, target_shape",
+    [
+        ((20, 20, 20), (10, 10, 10)),
+        ((13, 7, 9), (30, 4, 1)),
+        ((50, 40, 30), (37, 61, 29)),
+    ],
+)
+def test_rescale_array_matches_scipy(source_shape, target_shape, dtype):
+    """
+    Test that linear rescaling of 3D arrays gives exactly the same result
+    as scipy.ndimage.zoom.
+    """
+    rng = np.random.default_rng(0)
+    source_array = (rng.random(source_shape) * 200).astype(dtype)
+    zoom_factors = [t / s for s, t in zip(source_shape, target_shape)]
+
+    expected = zoom(source_array, zoom_factors, order=1)
+    rescaled = rescale_array(source_array, np.zeros(target_shape))
+
+    assert rescaled.dtype == expected.dtype
+    np.testing.assert_array_equal(rescaled, expected)
+
+
+@pytest.mark.parametrize("dtype", [">f8", ">i2", np.bool_])
+def test_rescale_array_unsupported_kernel_dtype(dtype):
+    """
+    Test that dtypes the linear zoom kernel can't handle are rescaled with
+    scipy.ndimage.zoom instead.
+    """
+    source_array = np.arange(4 * 5 * 6).reshape(4, 5, 6).astype(dtype)
+    zoom_factors = [2, 0.5, 1]
+
+    expected = zoom(source_array, zoom_factors, order=1)
+    rescaled = rescale_array(source_array, np.zeros((8, 2, 6)))
+
+    assert rescaled.dtype == expected.dtype
+    np.testing.assert_array_equal(rescaled, expected)
+
+
+def test_rescale_array_float16():
+    """
+    Test that float16 arrays aren't passed to the linear zoom kernel, which
+    doesn't support them, but give the same error as scipy.ndimage.zoom.
+    """
+    source_array = np.ones((4, 4, 4), dtype=np.float16)
+    with pytest.raises(RuntimeError, match="data type not supported"):
+        rescale_array(source_array, np.zeros((2, 2, 2)))
+
+
 def test_heatmap_from_points(
     tmp_path, mask_array, points, heatmap_validate_path
 ):
@@ -51,3 +113,44 @@ def test_heatmap_from_points(
 
     heatmap_file = imread(output_filename)
     assert np.array_equal(heatmap_validate, heatmap_file)
+
+
+@pytest.mark.parametrize(
+    "image_shape, bin_sizes",
+    [
+        ((20, 20, 20), (2, 2, 2)),
+        ((21, 17, 33), (2, 3, 5)),
+        ((20, 21, 22), (2.5, 1.5, 0.7)),
+    ],
+)
+def test_count_points_per_bin(image_shape, bin_sizes):
+    """
+    Test that points are binned as np.histogramdd would, including points
+    on the last bin edge and outside the bins.
+    """
+    rng = np.random.default_rng(seed=0)
+    points = rng.uniform(-2, max(image_shape) + 2, size=(1000, 3))
+    points[:10] = np.round(points[:10])
+    points[10] = [bin_dim[-1] for bin_dim in get_bins(image_shape, bin_sizes)]
+
+    expected, _ = np.histogramdd(points, bins=get_bins(image_shape, bin_sizes))
+    counts = _count_points_per_bin(points, image_shape, bin_sizes)
+    assert np.array_equal(counts, expected)
+
+
+@pytest.mark.parametrize("image_dtype", [np.float64, np.float32, np.uint16])
+@pytest.mark.parametrize("mask_dtype", [np.float64, np.uint8, bool])
+def test_mask_and_scale_to_16_bits(image_dtype, mask_dtype):
+    """
+    Test that masking and scaling in one step gives the same result as
+    masking, then scaling.
+    """
+    rng = np.random.default_rng(0)
+    image = (rng.random((10, 20, 30)) * 1000).astype(image_dtype)
+    mask = (rng.random((10, 20, 30)) * 2).astype(mask_dtype)
+
+    expected = scale_and_convert_to_16_bits(mask_image_threshold(image, mask))
+    scaled = _mask_and_scale_to_16_bits(image, mask)
+
+    assert scaled.dtype == np.uint16
+    np.testing.assert_array_equal(scaled, expected)
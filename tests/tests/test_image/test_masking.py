@@ -41,9 +41,52 @@ def masked_image():
 
 
 def test_make_mask(mask_val_4, raw_image):
-    assert (mask_val_4 == masking.make_mask(raw_image, threshold=4)).all()
+    mask = masking.make_mask(raw_image, threshold=4)
+    assert (mask_val_4 == mask).all()
+    assert mask.dtype == np.uint8
 
 
 def test_mask_image_threshold(raw_image, masked_image):
     result = masking.mask_image_threshold(raw_image, raw_image, threshold=4)
     assert (result == masked_image).all()
+    assert result.dtype == raw_image.dtype
+
+
+@pytest.mark.parametrize(
+    "image_shape, mask_shape",
+    [
+        ((4, 5, 6), (4, 5, 6)),
+        ((5, 6), (4, 5, 6)),
+        ((4, 1, 6), (4, 5, 6)),
+        ((4, 5, 6), (5, 1)),
+    ],
+)
+@pytest.mark.parametrize(
+    "image_dtype, mask_dtype",
+    [(np.uint16, np.uint16), (np.uint8, np.float64), (np.float32, bool)],
+)
+def test_mask_image_threshold_matches_make_mask(
+    image_shape, mask_shape, image_dtype, mask_dtype
+):
+    """
+    Test that masking gives the same values, dtype and shape as multiplying
+    by make_mask, for images and masks whose shapes broadcast together.
+    """
+    rng = np.random.default_rng(0)
+    image = (rng.random(image_shape) * 10).astype(image_dtype)
+    masking_image = (rng.random(mask_shape) * 10).astype(mask_dtype)
+
+    expected = image * masking.make_mask(masking_image, threshold=0.5)
+    result = masking.mask_image_threshold(image, masking_image, threshold=0.5)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_make_mask_out(mask_val_4, raw_image):
+    out = np.empty(raw_image.shape, dtype=np.uint8)
+    mask = masking.make_mask(raw_image, threshold=4, out=out)
+    assert mask is out
+    assert (mask_val_4 == mask).all()
+
+    with pytest.raises(ValueError):
+        masking.make_mask(raw_image, out=np.empty(raw_image.shape))